@@ -3,15 +3,24 @@
 Pure Python, standard library only. No I/O, no async.
 
 Keys are non-empty strings over a base-62 alphabet whose ASCII ordering
-matches its semantic ordering. ``key_between(a, b)`` returns a key strictly
-between ``a`` and ``b`` in lexicographic order (with ``None`` meaning
-"unbounded on that side"). Repeated insertion at a contended position grows
-keys logarithmically rather than collapsing — which is the failure mode of
-the previous float-midpoint scheme.
+matches its semantic ordering, and never end in ``"0"`` (nothing sorts between
+``"x"`` and ``"x0"``). ``key_between(a, b)`` returns a key strictly between
+``a`` and ``b`` in lexicographic order (with ``None`` meaning "unbounded on
+that side").
+
+Appends and prepends step the neighbouring key like a fixed-width counter and
+double the width when it runs out, so a list built by N pushes has keys of
+O(log N) length. Repeated insertion between the same two keys halves the gap
+each time and grows keys linearly (about one character per six inserts), which
+is inherent to fractional indexing — but unlike the previous float-midpoint
+scheme it never collapses.
 """
 
 BASE_62_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 
+_FIRST = BASE_62_DIGITS[0]
+_LAST = BASE_62_DIGITS[-1]
+
 
 def key_between(a: str | None, b: str | None) -> str:
     """Return a key ``k`` such that ``a < k < b`` in lex order.
@@ -21,42 +30,89 @@ def key_between(a: str | None, b: str | None) -> str:
     Both ``None`` returns the midpoint of the key space (used to seed an
     empty list).
     """
+    if a is not None and b is None:
+        return _after(a)
+    if a is None and b is not None:
+        return _before(b)
     a_s = a if a is not None else ""
     if b is not None and a_s >= b:
         raise ValueError(f"a must be strictly less than b: a={a!r} b={b!r}")
     return _midpoint(a_s, b)
 
 
+def _after(a: str) -> str:
+    """Smallest step above ``a`` at its width, or a doubled width when full."""
+    i = len(a) - 1
+    while i >= 0 and a[i] == _LAST:
+        i -= 1
+    if i < 0:
+        # "zz...z": no room at this width; open up as many new digits again.
+        return a + _FIRST * (len(a) - 1) + BASE_62_DIGITS[1]
+
+    bumped = BASE_62_DIGITS[BASE_62_DIGITS.index(a[i]) + 1]
+    if i == len(a) - 1:
+        return a[:i] + bumped
+    # The carry zeroed the tail; keep the width but end in "1", not "0".
+    return a[:i] + bumped + _FIRST * (len(a) - i - 2) + BASE_62_DIGITS[1]
+
+
+def _before(b: str) -> str:
+    """Largest step below ``b`` at its width, or a doubled width when empty."""
+    last = BASE_62_DIGITS.index(b[-1])
+    if last > 1:
+        return b[:-1] + BASE_62_DIGITS[last - 1]
+
+    # b ends in "1": one step down would end in "0", so borrow instead.
+    i = len(b) - 2
+    while i >= 0 and b[i] == _FIRST:
+        i -= 1
+    if i < 0:
+        # "00...01": the smallest key at this width.
+        return _FIRST * len(b) + _LAST * len(b)
+
+    lowered = BASE_62_DIGITS[BASE_62_DIGITS.index(b[i]) - 1]
+    return b[:i] + lowered + _LAST * (len(b) - i - 1)
+
+
 def _midpoint(a: str, b: str | None) -> str:
-    # Length of longest common prefix between a and b (treating b=None as
-    # unbounded — no common prefix).
-    n = 0
-    while n < len(a) and b is not None and n < len(b) and a[n] == b[n]:
-        n += 1
-    if n > 0:
-        return a[:n] + _midpoint(a[n:], b[n:] if b is not None else None)
-
-    # No common prefix. Look at the first differing digit on each side.
-    digit_a = BASE_62_DIGITS.index(a[0]) if a else 0
-    digit_b = (
-        BASE_62_DIGITS.index(b[0])
-        if (b is not None and len(b) > 0)
-        else len(BASE_62_DIGITS)
-    )
-
-    if digit_b - digit_a > 1:
-        # Room for a midpoint digit at this position.
-        mid = (digit_a + digit_b) // 2
-        return BASE_62_DIGITS[mid]
-
-    # Digits are adjacent (or b shares a's leading digit with extra suffix).
-    # Need to extend.
-    if b is not None and len(b) > 1:
-        # Use b's leading digit and recurse on (empty, rest of b) to land
-        # below the rest of b at the next position.
-        return b[:1] + _midpoint("", b[1:])
-
-    # b is None or single-digit. Use a's leading digit (or '0' if a empty)
-    # and extend after a.
-    a_first = a[:1] if a else BASE_62_DIGITS[0]
-    return a_first + _midpoint(a[1:] if len(a) > 1 else "", None)
+    # Iterative so that long keys (deep contended inserts) cannot exhaust the
+    # recursion limit. Each pass either finishes or moves one position right.
+    prefix = []
+    while True:
+        # Copy the longest common prefix between a and b (treating b=None as
+        # unbounded — no common prefix).
+        n = 0
+        while n < len(a) and b is not None and n < len(b) and a[n] == b[n]:
+            n += 1
+        if n > 0:
+            prefix.append(a[:n])
+            a = a[n:]
+            b = b[n:] if b is not None else None
+            continue
+
+        # No common prefix. Look at the first differing digit on each side.
+        digit_a = BASE_62_DIGITS.index(a[0]) if a else 0
+        digit_b = (
+            BASE_62_DIGITS.index(b[0])
+            if (b is not None and len(b) > 0)
+            else len(BASE_62_DIGITS)
+        )
+
+        if digit_b - digit_a > 1:
+            # Room for a midpoint digit at this position.
+            prefix.append(BASE_62_DIGITS[(digit_a + digit_b) // 2])
+            return "".join(prefix)
+
+        # Digits are adjacent (or b shares a's leading digit with extra suffix).
+        # Need to extend.
+        if b is not None and len(b) > 1:
+            # Use b's leading digit and continue with (empty, rest of b) to
+            # land below the rest of b at the next position.
+            prefix.append(b[:1])
+            a, b = "", b[1:]
+            continue
+
+        # b is None or single-digit. Use a's leading digit (or '0' if a empty)
+        # and extend after a.
+        prefix.append(a[:1] if a else _FIRST)
+        a, b = a[1:], None
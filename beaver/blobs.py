@@ -213,7 +213,7 @@ class AsyncBeaverBlob[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverBlob[T]):
                 "items": items,
             }
             if fp:
-                json.dump(dump_obj, fp, indent=indent)
+                fp.write(self._encode_dump(dump_obj, indent))
                 return None
             return dump_obj
         if format == "jsonl":
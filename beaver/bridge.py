@@ -1,5 +1,7 @@
 import asyncio
+import collections
 import inspect
+import weakref
 from typing import Any, Iterator, AsyncIterator
 
 
@@ -7,34 +9,122 @@ class _SyncIteratorBridge:
     """
     Helper class that wraps an AsyncIterator (or AsyncGenerator)
     and exposes it as a standard synchronous Iterator.
+
+    Each hop to the reactor thread returns every item the iterator can
+    produce without waiting (up to _BATCH), so in-memory chunks such as a
+    list's fetched rows cross threads once per batch instead of once per item.
+    At most one step that had to wait is left running for the next hop, so
+    an iterator dropped early must be closed: close() (or garbage collection,
+    or closing the database) cancels that step and closes the generator.
     """
 
+    _BATCH = 256
+
     def __init__(self, async_iter: AsyncIterator, loop: asyncio.AbstractEventLoop):
         self._async_iter = async_iter
         self._loop = loop
+        self._buffer: collections.deque = collections.deque()
+        self._pending: asyncio.Future | None = None
+        self._error: BaseException | None = None
+        self._exhausted = False
+        _open_iterators.add(self)
 
     def __iter__(self):
         return self
 
-    def __next__(self):
-        # Define a coroutine to fetch the next item safely on the background loop
-        async def step():
+    async def _fill(self) -> list[Any]:
+        items: list[Any] = []
+        while len(items) < self._BATCH:
+            step = self._pending or asyncio.ensure_future(anext(self._async_iter))
+            self._pending = None
+            if items:
+                # Take only what is ready after one loop turn; a step still
+                # waiting (new rows, a live tail) carries over to the next hop.
+                await asyncio.sleep(0)
+                if not step.done():
+                    self._pending = step
+                    break
             try:
-                # Use the builtin anext() (Python 3.10+)
-                return await anext(self._async_iter)
+                items.append(await step)
             except StopAsyncIteration:
-                # Raise a special sentinel to signal the loop to stop
-                return StopAsyncIteration
+                self._exhausted = True
+                break
+            except Exception as e:
+                if not items:
+                    raise
+                # Hand over what was produced first; raise on the next call.
+                self._error = e
+                break
+        return items
+
+    async def _aclose(self):
+        _open_iterators.discard(self)
+        self._exhausted = True
+        self._error = None
+        self._buffer.clear()
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            # The step is running the generator; it has to stop before the
+            # generator can be closed.
+            pending.cancel()
+            try:
+                await pending
+            except BaseException:
+                pass
+        aclose = getattr(self._async_iter, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    def close(self):
+        """Stops the iterator early, releasing what its generator holds."""
+        if self not in _open_iterators or not self._loop.is_running():
+            self._exhausted = True
+            return
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._loop.create_task(self._aclose())
+        else:
+            asyncio.run_coroutine_threadsafe(self._aclose(), self._loop).result()
+
+    def __del__(self):
+        # Never block here: the collector may run on the reactor thread.
+        if self._pending is not None and self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._aclose(), self._loop)
+
+    def __next__(self):
+        if self._buffer:
+            return self._buffer.popleft()
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+        if self._exhausted:
+            raise StopIteration
 
         # Run the step on the reactor thread
-        future = asyncio.run_coroutine_threadsafe(step(), self._loop)
-        result = future.result()
+        future = asyncio.run_coroutine_threadsafe(self._fill(), self._loop)
+        self._buffer.extend(future.result())
 
-        # Propagate the stop signal as a synchronous StopIteration
-        if result is StopAsyncIteration:
+        if not self._buffer:
             raise StopIteration
 
-        return result
+        return self._buffer.popleft()
+
+
+# Sync iterators not yet exhausted or closed, so closing the database can
+# close them too. Weak: dropping an iterator still lets GC reclaim it.
+_open_iterators: "weakref.WeakSet[_SyncIteratorBridge]" = weakref.WeakSet()
+
+
+async def close_open_iterators(loop: asyncio.AbstractEventLoop) -> None:
+    """Closes the sync iterators still open on `loop`, before it stops."""
+    for iterator in list(_open_iterators):
+        if iterator._loop is loop:
+            await iterator._aclose()
 
 
 class BeaverBridge:
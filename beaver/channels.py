@@ -27,6 +27,8 @@ class PubSubEngine:
         self._running = False
         self._task: asyncio.Task | None = None
         self._last_poll_ts = time.time()
+        # Set by local publishers so the loop polls now instead of sleeping on
+        self._wakeup = asyncio.Event()
 
     async def start(self):
         """Starts the background polling loop."""
@@ -48,6 +50,10 @@ class PubSubEngine:
                 pass
             self._task = None
 
+    def notify(self):
+        """Wakes the polling loop early; called after a local publish."""
+        self._wakeup.set()
+
     def subscribe(self, channel: str) -> asyncio.Queue[ChannelMessage]:
         """Registers a new listener queue for a channel."""
         queue = asyncio.Queue[ChannelMessage]()
@@ -76,20 +82,20 @@ class PubSubEngine:
         while self._running:
             try:
                 # 1. Fetch new messages globally
-                # We use a raw execute here to avoid locking the transaction logic
-                # for simple reads.
-                cursor = await self.db.connection.execute(
-                    """
-                    SELECT timestamp, channel_name, message_payload
-                    FROM __beaver_pubsub_log__
-                    WHERE timestamp > ?
-                    ORDER BY timestamp ASC
-                    """,
-                    (self._last_poll_ts,),
-                )
-
-                rows = await cursor.fetchall()
-                rows = list(rows)
+                # The read shares the writers' connection, so it must not run
+                # inside an open transaction: it would see rows that may still
+                # roll back. Holding the writer lock for this one short read
+                # keeps it between transactions.
+                async with self.db._tx_lock:
+                    rows = await self.db.connection.execute_fetchall(
+                        """
+                        SELECT timestamp, channel_name, message_payload
+                        FROM __beaver_pubsub_log__
+                        WHERE timestamp > ?
+                        ORDER BY timestamp ASC
+                        """,
+                        (self._last_poll_ts,),
+                    )
 
                 if rows:
                     # Update high-water mark
@@ -108,9 +114,13 @@ class PubSubEngine:
                             for q in self._listeners[channel]:
                                 q.put_nowait(msg)
 
-                # 3. Wait before next poll
-                # Adaptive sleep could be added here (e.g. sleep less if busy)
-                await asyncio.sleep(0.1)
+                # 3. Wait before next poll, or until a local publish wakes us.
+                # Other processes' messages are still picked up by the timeout.
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=0.1)
+                except TimeoutError:
+                    pass
+                self._wakeup.clear()
 
             except asyncio.CancelledError:
                 break
@@ -139,11 +149,21 @@ class AsyncBeaverChannel[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverChannel[T
         """
         Publishes a message to the channel.
         """
-        # Ensure engine is running (in case we are the first publisher)
-        await self._get_engine()
+        await self._publish_raw(payload)
 
-        # Serialize
-        data_str = self._serialize(payload)
+    async def _publish_raw(self, payload: T):
+        """
+        Inserts a message without taking the channel's lock or opening a
+        transaction. The caller must already be inside one (see events.emit).
+        """
+        await self._publish_serialized(self._serialize(payload))
+
+    async def _publish_serialized(self, data_str: str):
+        """
+        Same as _publish_raw, for a payload the caller already serialized.
+        """
+        # Ensure engine is running (in case we are the first publisher)
+        engine = await self._get_engine()
         ts = time.time()
 
         # Monotonicity check (simple collision avoidance)
@@ -152,6 +172,9 @@ class AsyncBeaverChannel[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverChannel[T
             "INSERT INTO __beaver_pubsub_log__ (timestamp, channel_name, message_payload) VALUES (?, ?, ?)",
             (ts, self._name, data_str),
         )
+        # Wake the engine only once the message is committed: its poll runs on
+        # this same connection and would otherwise deliver an uncommitted row.
+        self._db._call_after_commit(engine.notify)
 
     async def listen(self) -> AsyncIterator[ChannelMessage[T]]:
         """
@@ -100,6 +100,12 @@ def _build_command(method_name: str, meta: EndpointMeta, manager_accessor: Calla
             decoded = _read_json_value(value)
             _run(ctx, manager_accessor, method_name, value=decoded)
 
+    elif method_name == "extend":
+
+        def cmd(ctx: typer.Context, values: str = typer.Argument(None)):
+            decoded = _read_json_value(values)
+            _run(ctx, manager_accessor, method_name, values=decoded)
+
     elif method_name == "insert":
 
         def cmd(ctx: typer.Context, index: int, value: str = typer.Argument(None)):
@@ -111,6 +117,11 @@ def _build_command(method_name: str, meta: EndpointMeta, manager_accessor: Calla
         def cmd(ctx: typer.Context):
             _run(ctx, manager_accessor, method_name)
 
+    elif method_name == "popmany":
+
+        def cmd(ctx: typer.Context, count: int):
+            _run(ctx, manager_accessor, method_name, count=count)
+
     # --- log shapes ---
     elif method_name == "log":
 
@@ -10,6 +10,7 @@ from typing import Any, Callable, ClassVar
 import httpx
 
 from .api import EndpointMeta
+from .bridge import BeaverBridge, close_open_iterators
 from .dicts import AsyncBeaverDict
 from .lists import AsyncBeaverList
 from .logs import AsyncBeaverLog
@@ -169,6 +170,9 @@ class RemoteList:
     async def push(self, value):
         return await self._BUILDERS["push"](self._http, self._name, value=value)
 
+    async def extend(self, values: list):
+        return await self._BUILDERS["extend"](self._http, self._name, values=values)
+
     async def prepend(self, value):
         return await self._BUILDERS["prepend"](self._http, self._name, value=value)
 
@@ -183,6 +187,9 @@ class RemoteList:
     async def deque(self):
         return await self._BUILDERS["deque"](self._http, self._name)
 
+    async def popmany(self, count: int):
+        return await self._BUILDERS["popmany"](self._http, self._name, count=count)
+
     async def clear(self):
         return await self._BUILDERS["clear"](self._http, self._name)
 
@@ -342,6 +349,7 @@ class BeaverClient:
             return
 
         async def shutdown():
+            await close_open_iterators(self._loop)
             await self._async.close()
 
         future = asyncio.run_coroutine_threadsafe(shutdown(), self._loop)
@@ -369,8 +377,6 @@ class BeaverClient:
         return self._bridged(lambda: self._async.log(name, model))
 
     def _bridged(self, factory_sync):
-        from .bridge import BeaverBridge
-
         async def factory():
             return factory_sync()
 
@@ -1,7 +1,8 @@
 import asyncio
+import contextlib
 import json
 import threading
-from typing import Any, Self, Type, AsyncContextManager
+from typing import Any, AsyncContextManager, Callable, Self, Type
 
 import aiosqlite
 from pydantic import BaseModel
@@ -22,8 +23,9 @@ from .interfaces import (
 )
 
 
+from ._fracdex import key_between
 from .blobs import AsyncBeaverBlob
-from .bridge import BeaverBridge
+from .bridge import BeaverBridge, close_open_iterators
 from .cache import DummyCache
 from .channels import AsyncBeaverChannel, PubSubEngine
 from .dicts import AsyncBeaverDict
@@ -89,6 +91,11 @@ class Transaction:
     If a task already holds the transaction lock (nested @atomic calls),
     this acts as a pass-through. The actual BEGIN/COMMIT only happens
     at the outermost level.
+
+    `_tx_lock` doubles as the process-wide writer lock: every write path
+    goes through @atomic (or a batch) and therefore through here, so only
+    one task at a time awaits SQLite's write lock. Plain reads execute on
+    the connection directly and never wait on it.
     """
 
     def __init__(self, db: "AsyncBeaverDB"):
@@ -119,6 +126,7 @@ class Transaction:
         if not self._is_root:
             return
 
+        callbacks, self.db._after_commit = self.db._after_commit, []
         try:
             if exc_type:
                 await self.db.connection.rollback()
@@ -129,6 +137,10 @@ class Transaction:
             self.db._tx_owner_task = None
             self.db._tx_lock.release()
 
+        if not exc_type:
+            for callback in callbacks:
+                callback()
+
 
 class AsyncBeaverDB:
     """
@@ -150,6 +162,8 @@ class AsyncBeaverDB:
         pragma_synchronous: bool = False,
         pragma_temp_memory: bool = True,
         pragma_mmap_size: int = 256 * 1024 * 1024,
+        pragma_cache_size: int = -64 * 1024,
+        index_list_values: bool = False,
     ):
         self._db_path = db_path
         self._timeout = connection_timeout
@@ -158,9 +172,17 @@ class AsyncBeaverDB:
         # The Single Source of Truth Connection
         self._connection: aiosqlite.Connection | None = None
 
-        # Locking Primitives
+        # Locking Primitives (the tx lock serializes all in-process writers)
         self._tx_lock = asyncio.Lock()
         self._tx_owner_task: asyncio.Task | None = None  # Track owner for reentrancy
+        # Run once the owner's transaction commits; dropped on rollback.
+        self._after_commit: list[Callable[[], None]] = []
+
+        # Lock hand-off within this process: waiters park on an Event per lock
+        # name and are woken as soon as a local holder leaves the queue.
+        self._lock_waiters: dict[str, set[asyncio.Event]] = {}
+        # Local log.live() tails, woken by writes from this process.
+        self._log_tails: dict[str, set[asyncio.Event]] = {}
 
         # Manager Singleton Cache
         self._manager_cache: dict[tuple[type, str], Any] = {}
@@ -170,6 +192,8 @@ class AsyncBeaverDB:
         self._pragma_synchronous = pragma_synchronous
         self._pragma_temp_memory = pragma_temp_memory
         self._pragma_mmap_size = pragma_mmap_size
+        self._pragma_cache_size = pragma_cache_size
+        self._index_list_values = index_list_values
 
         # Pub/Sub Engine
         self._pubsub_engine: PubSubEngine | None = None
@@ -194,6 +218,9 @@ class AsyncBeaverDB:
             timeout=self._timeout,
             # We will manage transactions manually via .transaction()
             isolation_level=None,
+            # All managers share this one connection, and together they issue
+            # more distinct statements than sqlite3's default LRU of 128 holds.
+            cached_statements=512,
         )
         # If any setup step below fails (e.g. an incompatible-schema version
         # check), close the just-opened connection so we don't leak its
@@ -201,6 +228,12 @@ class AsyncBeaverDB:
         try:
             self._connection.row_factory = aiosqlite.Row
 
+            # Lets list push/prepend mint their fracdex key inside the INSERT.
+            # Connection-scoped: nothing is stored in the file.
+            await self._connection.create_function(
+                "beaver_key_between", 2, key_between, deterministic=True
+            )
+
             # Apply Pragmas
             if self._pragma_wal:
                 await self._connection.execute("PRAGMA journal_mode = WAL;")
@@ -218,6 +251,13 @@ class AsyncBeaverDB:
                     f"PRAGMA mmap_size = {self._pragma_mmap_size};"
                 )
 
+            # Page cache for the single shared connection. Negative values are
+            # KiB (SQLite's convention); 0 keeps SQLite's 2 MiB default.
+            if self._pragma_cache_size != 0:
+                await self._connection.execute(
+                    f"PRAGMA cache_size = {int(self._pragma_cache_size)};"
+                )
+
             await self._check_version()
             await self._create_all_tables()
             await self._connection.execute(f"PRAGMA user_version = {BEAVER_DB_VERSION}")
@@ -237,6 +277,54 @@ class AsyncBeaverDB:
         # Clear cache to allow GC
         self._manager_cache.clear()
 
+    def _committed_read(self) -> AsyncContextManager:
+        """Guards a plain read on the shared connection so it only sees
+        committed rows: another task's open transaction would otherwise leak
+        its uncommitted writes into it. The owner of the transaction reads
+        its own writes directly."""
+        if self._tx_owner_task is asyncio.current_task():
+            return contextlib.nullcontext()
+        return self._tx_lock
+
+    def _call_after_commit(self, callback: Callable[[], None]):
+        """Runs `callback` once the current task's transaction commits (never,
+        if it rolls back), or right away outside a transaction. For signals
+        that must not announce rows a rollback could still take back."""
+        if self._tx_owner_task is asyncio.current_task():
+            self._after_commit.append(callback)
+        else:
+            callback()
+
+    def _watch_lock(self, name: str, wake: asyncio.Event):
+        self._lock_waiters.setdefault(name, set()).add(wake)
+
+    def _unwatch_lock(self, name: str, wake: asyncio.Event):
+        waiters = self._lock_waiters.get(name)
+        if waiters is not None:
+            waiters.discard(wake)
+            if not waiters:
+                del self._lock_waiters[name]
+
+    def _wake_lock_waiters(self, name: str):
+        """Tells local waiters on `name` that the queue changed."""
+        for wake in self._lock_waiters.get(name, ()):
+            wake.set()
+
+    def _watch_log(self, name: str, wake: asyncio.Event):
+        self._log_tails.setdefault(name, set()).add(wake)
+
+    def _unwatch_log(self, name: str, wake: asyncio.Event):
+        tails = self._log_tails.get(name)
+        if tails is not None:
+            tails.discard(wake)
+            if not tails:
+                del self._log_tails[name]
+
+    def _wake_log_tails(self, name: str):
+        """Tells local live() tails on `name` that entries were written."""
+        for wake in self._log_tails.get(name, ()):
+            wake.set()
+
     async def __aenter__(self):
         return await self.connect()
 
@@ -449,6 +537,16 @@ class AsyncBeaverDB:
             )
         """
         )
+        # Opt-in: membership tests (list.contains) seek on the value instead of
+        # comparing every item, at the cost of slower list writes and a second
+        # copy of every value on disk. Once built it stays in the file.
+        if self._index_list_values:
+            await c.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_lists_value
+                ON __beaver_lists__ (list_name, item_value)
+            """
+            )
 
         # Locks
         await c.execute(
@@ -615,13 +713,17 @@ class AsyncBeaverDB:
         """
         )
 
-        # Index for reverse lookups (parents)
+        # Index for reverse lookups (parents). Covering, and including label:
+        # the older (collection, target_item_id) index was not covering, so
+        # the planner preferred the PK and scanned the whole collection.
         await c.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_edges_target
-            ON __beaver_edges__ (collection, target_item_id)
+            CREATE INDEX IF NOT EXISTS idx_edges_target_label
+            ON __beaver_edges__ (collection, target_item_id, label, source_item_id)
         """
         )
+        # Strict prefix of the index above; only costs writes now.
+        await c.execute("DROP INDEX IF EXISTS idx_edges_target")
 
         # Vectors (Main Store)
         await c.execute(
@@ -831,6 +933,7 @@ class BeaverDB:
             return
 
         async def shutdown():
+            await close_open_iterators(self._loop)
             await self._async_db.close()
 
         future = asyncio.run_coroutine_threadsafe(shutdown(), self._loop)
@@ -354,7 +354,7 @@ class AsyncBeaverDict[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverDict[T]):
         async for k, v in self.items():
             val = v
             if self._model and isinstance(v, BaseModel):
-                val = json.loads(v.model_dump_json())
+                val = v.model_dump(mode="json")
             yield {"key": k, "value": val}
 
     @local_only(
@@ -378,7 +378,7 @@ class AsyncBeaverDict[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverDict[T]):
                 "items": items,
             }
             if fp:
-                json.dump(dump_obj, fp, indent=indent)
+                fp.write(self._encode_dump(dump_obj, indent))
                 return None
             return dump_obj
         if format == "jsonl":
@@ -557,7 +557,7 @@ class AsyncBeaverDocuments[T: BaseModel](AsyncBeaverBase[T]):
         async for doc in self:
             body_val = doc.body
             if self._model and isinstance(body_val, BaseModel):
-                body_val = json.loads(body_val.model_dump_json())
+                body_val = body_val.model_dump(mode="json")
             yield {"id": doc.id, "body": body_val}
 
     async def dump(
@@ -582,7 +582,7 @@ class AsyncBeaverDocuments[T: BaseModel](AsyncBeaverBase[T]):
                 "items": items,
             }
             if fp:
-                json.dump(dump_obj, fp, indent=indent)
+                fp.write(self._encode_dump(dump_obj, indent))
                 return None
             return dump_obj
         if format == "jsonl":
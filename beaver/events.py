@@ -1,9 +1,12 @@
 import asyncio
 import inspect
+import time
+import uuid
 from typing import Any, Callable, Protocol, runtime_checkable, TYPE_CHECKING
 import weakref
 
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 from .manager import AsyncBeaverBase, atomic
 from .channels import AsyncBeaverChannel
@@ -62,7 +65,8 @@ class AsyncBeaverEvents[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverEvents[T])
 
     def __init__(self, name: str, db: "AsyncBeaverDB", model: type[T] | None = None):
         super().__init__(name, db, model)
-        self._callbacks: dict[str, list[Callable]] = {}
+        # (callback, is_async) pairs; is_async is resolved once in attach()
+        self._callbacks: dict[str, list[tuple[Callable, bool]]] = {}
         self._listening = False
         self._listener_task: asyncio.Task | None = None
 
@@ -87,12 +91,14 @@ class AsyncBeaverEvents[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverEvents[T])
             # Unwrap the envelope (which is a raw dict from channel)
             event = msg.payload
 
-            # Validate envelope structure
-            event_name = event.event
+            # Skip events nobody on this bus is attached to
+            callbacks = self._callbacks.get(event.event)
+            if not callbacks:
+                continue
 
             # Execute Callbacks
-            for callback in self._callbacks.get(event_name, []):
-                if inspect.iscoroutinefunction(callback):
+            for callback, is_async in callbacks:
+                if is_async:
                     # Run async callbacks concurrently
                     asyncio.create_task(callback(event))
                 else:
@@ -106,21 +112,55 @@ class AsyncBeaverEvents[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverEvents[T])
         if event not in self._callbacks:
             self._callbacks[event] = []
 
-        if callback not in self._callbacks[event]:
-            self._callbacks[event].append(callback)
+        if all(cb != callback for cb, _ in self._callbacks[event]):
+            self._callbacks[event].append(
+                (callback, inspect.iscoroutinefunction(callback))
+            )
 
         return EventHandler(self, event, callback)
 
     async def detach(self, event: str, callback: Callable[[Event[T]], Any]):
         """Detaches a callback."""
         if event in self._callbacks:
-            if callback in self._callbacks[event]:
-                self._callbacks[event].remove(callback)
+            self._callbacks[event] = [
+                entry for entry in self._callbacks[event] if entry[0] != callback
+            ]
+            if not self._callbacks[event]:
+                del self._callbacks[event]
+
+        # Last callback gone: stop polling the channel until the next attach.
+        if not self._callbacks:
+            await self._stop_listener()
+
+    async def _stop_listener(self):
+        """Cancels the dispatch loop, which unsubscribes from the channel."""
+        task = self._listener_task
+        self._listening = False
+        self._listener_task = None
+
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
     @atomic
     async def emit(self, event: str, payload: T):
         """
         Emits an event.
         """
-        # Publish to the underlying channel
-        await self._channel.publish(Event(event=event, payload=payload))
+        # Serialize the envelope directly: building an Event model only to
+        # dump it again costs a validation pass and produces the same JSON.
+        envelope = to_json(
+            {
+                "id": uuid.uuid4().hex,
+                "event": event,
+                "payload": payload,
+                "timestamp": time.time(),
+            }
+        ).decode()
+
+        # Publish inside this transaction rather than through publish(),
+        # which would take the channel's own lock for the same single INSERT.
+        await self._channel._publish_serialized(envelope)
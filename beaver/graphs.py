@@ -1,4 +1,6 @@
+import collections
 import json
+import time
 from typing import (
     Iterator,
     AsyncIterator,
@@ -28,11 +30,94 @@ class AsyncBeaverGraph[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverGraph[T]):
     - __beaver_edges__ (collection, source_item_id, target_item_id, label, metadata)
     """
 
+    # Traversal SQL keyed by whether a label filter applies. The text is static
+    # per variant, so sqlite3's statement cache reuses the parsed statement
+    # instead of re-preparing a freshly concatenated string on every call.
+    _SQL_CHILDREN = {
+        False: "SELECT target_item_id FROM __beaver_edges__ WHERE collection = ? AND source_item_id = ?",
+        True: "SELECT target_item_id FROM __beaver_edges__ WHERE collection = ? AND source_item_id = ? AND label = ?",
+    }
+    _SQL_PARENTS = {
+        False: "SELECT source_item_id FROM __beaver_edges__ WHERE collection = ? AND target_item_id = ?",
+        True: "SELECT source_item_id FROM __beaver_edges__ WHERE collection = ? AND target_item_id = ? AND label = ?",
+    }
+    _SQL_EDGES = {
+        False: "SELECT target_item_id, label, metadata FROM __beaver_edges__ WHERE collection = ? AND source_item_id = ?",
+        True: "SELECT target_item_id, label, metadata FROM __beaver_edges__ WHERE collection = ? AND source_item_id = ? AND label = ?",
+    }
+
+    # Most (direction, node, label) neighbour lists the adjacency cache keeps;
+    # the least recently used are evicted past this.
+    _ADJACENCY_MAX_ENTRIES = 10_000
+
     def __init__(self, name: str, db: "AsyncBeaverDB", model: type[T] | None = None):
         super().__init__(name, db, model)
         # Construct the concrete Edge model for this manager
         self._edge_model = Edge[model] if model else Edge
 
+        # Adjacency cache, used only when the db has cache_timeout > 0.
+        # Keyed by (direction, node, label); validated against this graph's
+        # row in __beaver_manager_versions__, re-read at most once per timeout.
+        # Bounded LRU, so a traversal of a large graph can't pin every node's
+        # neighbours in memory while the graph goes unwritten.
+        self._adjacency: collections.OrderedDict[
+            tuple[str, str, str | None], list[str]
+        ] = collections.OrderedDict()
+        self._adjacency_version = -1
+        self._adjacency_checked_at = float("-inf")
+
+    async def _touch(self):
+        """
+        Bumps this graph's version so caching readers (in any process) drop
+        their adjacency. Runs inside the caller's transaction.
+        """
+        await self.connection.execute(
+            """
+            INSERT INTO __beaver_manager_versions__ (namespace, version) VALUES (?, 1)
+            ON CONFLICT(namespace) DO UPDATE SET version = version + 1
+            """,
+            (self._topic,),
+        )
+        # Force a version re-read on the next cached access rather than
+        # trusting our own bump: the transaction may still roll back.
+        self._adjacency.clear()
+        self._adjacency_checked_at = float("-inf")
+
+    async def _cached_adjacent(
+        self, direction: str, node: str, label: str | None
+    ) -> list[str]:
+        """Neighbour IDs of `node`, served from the adjacency cache."""
+        now = time.monotonic()
+        if now - self._adjacency_checked_at >= self._db._cache_timeout:
+            cursor = await self.connection.execute(
+                "SELECT version FROM __beaver_manager_versions__ WHERE namespace = ?",
+                (self._topic,),
+            )
+            row = await cursor.fetchone()
+            version = row[0] if row else 0
+            self._adjacency_checked_at = now
+            if version != self._adjacency_version:
+                self._adjacency.clear()
+                self._adjacency_version = version
+
+        key = (direction, node, label)
+        ids = self._adjacency.get(key)
+        if ids is not None:
+            self._adjacency.move_to_end(key)
+        else:
+            sql = self._SQL_CHILDREN if direction == "out" else self._SQL_PARENTS
+            params: tuple
+            if label:
+                query, params = sql[True], (self._name, node, label)
+            else:
+                query, params = sql[False], (self._name, node)
+            cursor = await self.connection.execute(query, params)
+            ids = [row[0] for row in await cursor.fetchall()]
+            self._adjacency[key] = ids
+            if len(self._adjacency) > self._ADJACENCY_MAX_ENTRIES:
+                self._adjacency.popitem(last=False)
+        return ids
+
     @emits(
         "link",
         payload=lambda s, t, l, *args, **kwargs: dict(source=s, target=t, label=l),
@@ -54,6 +139,37 @@ class AsyncBeaverGraph[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverGraph[T]):
             """,
             (self._name, source, target, label, meta_json),
         )
+        await self._touch()
+
+    @emits(
+        "bulk_link",
+        payload=lambda edges, *args, **kwargs: dict(count=len(edges)),
+    )
+    @atomic
+    async def bulk_link(self, edges: list[tuple]):
+        """
+        Creates or updates many directed edges in one transaction.
+        Each edge is (source, target, label) or (source, target, label, metadata).
+        """
+        rows = []
+        for edge in edges:
+            source, target, label, *rest = edge
+            metadata = rest[0] if rest else None
+            meta_json = self._serialize(metadata) if metadata else None
+            rows.append((self._name, source, target, label, meta_json))
+
+        if not rows:
+            return
+
+        await self.connection.executemany(
+            """
+            INSERT OR REPLACE INTO __beaver_edges__
+            (collection, source_item_id, target_item_id, label, metadata)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        await self._touch()
 
     @emits(
         "unlink",
@@ -69,6 +185,7 @@ class AsyncBeaverGraph[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverGraph[T]):
             """,
             (self._name, source, target, label),
         )
+        await self._touch()
 
     async def linked(self, source: str, target: str, label: str) -> bool:
         """Checks if a specific edge exists."""
@@ -114,14 +231,18 @@ class AsyncBeaverGraph[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverGraph[T]):
         Yields target IDs connected by outgoing edges from 'source'.
         (Forward traversal: source -> target)
         """
-        query = "SELECT target_item_id FROM __beaver_edges__ WHERE collection = ? AND source_item_id = ?"
-        params = [self._name, source]
+        if self._db._cache_timeout > 0:
+            for target in await self._cached_adjacent("out", source, label):
+                yield target
+            return
 
+        params: tuple
         if label:
-            query += " AND label = ?"
-            params.append(label)
+            query, params = self._SQL_CHILDREN[True], (self._name, source, label)
+        else:
+            query, params = self._SQL_CHILDREN[False], (self._name, source)
 
-        cursor = await self.connection.execute(query, tuple(params))
+        cursor = await self.connection.execute(query, params)
         async for row in cursor:
             yield row["target_item_id"]
 
@@ -132,32 +253,65 @@ class AsyncBeaverGraph[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverGraph[T]):
         Yields source IDs connected by incoming edges to 'target'.
         (Reverse traversal: source -> target)
         """
-        # This relies on the index (collection, target_item_id) for performance
-        query = "SELECT source_item_id FROM __beaver_edges__ WHERE collection = ? AND target_item_id = ?"
-        params = [self._name, target]
+        if self._db._cache_timeout > 0:
+            for src in await self._cached_adjacent("in", target, label):
+                yield src
+            return
 
+        # Served by the covering index (collection, target_item_id, label, source_item_id)
+        params: tuple
         if label:
-            query += " AND label = ?"
-            params.append(label)
+            query, params = self._SQL_PARENTS[True], (self._name, target, label)
+        else:
+            query, params = self._SQL_PARENTS[False], (self._name, target)
 
-        cursor = await self.connection.execute(query, tuple(params))
+        cursor = await self.connection.execute(query, params)
         async for row in cursor:
             yield row["source_item_id"]
 
+    async def traverse(
+        self, source: str, label: str | None = None, depth: int = 1
+    ) -> list[str]:
+        """
+        Returns the IDs reachable from 'source' within 'depth' outgoing hops,
+        in breadth-first order, each once (excluding 'source' itself).
+        With caching enabled, repeat traversals of a hot subgraph are served
+        from memory instead of one SQLite lookup per hop.
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1.")
+
+        seen = {source}
+        reached: list[str] = []
+        frontier = [source]
+
+        for _ in range(depth):
+            next_frontier = []
+            for node in frontier:
+                async for target in self.children(node, label):
+                    if target not in seen:
+                        seen.add(target)
+                        reached.append(target)
+                        next_frontier.append(target)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+
+        return reached
+
     async def edges(
         self, source: str, label: str | None = None
     ) -> AsyncIterator[Edge[T]]:
         """
         Yields full Edge objects (including metadata) originating from 'source'.
         """
-        query = "SELECT target_item_id, label, metadata FROM __beaver_edges__ WHERE collection = ? AND source_item_id = ?"
-        params = [self._name, source]
-
+        params: tuple
         if label:
-            query += " AND label = ?"
-            params.append(label)
+            query, params = self._SQL_EDGES[True], (self._name, source, label)
+        else:
+            query, params = self._SQL_EDGES[False], (self._name, source)
 
-        cursor = await self.connection.execute(query, tuple(params))
+        cursor = await self.connection.execute(query, params)
         async for row in cursor:
             meta_str = row["metadata"]
             meta_val = self._deserialize(meta_str) if meta_str else None
@@ -180,3 +334,4 @@ class AsyncBeaverGraph[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverGraph[T]):
         await self.connection.execute(
             "DELETE FROM __beaver_edges__ WHERE collection = ?", (self._name,)
         )
+        await self._touch()
@@ -385,11 +385,15 @@ class IAsyncBeaverGraph[T: BaseModel](Protocol):
     async def link(
         self, source: str, target: str, label: str, metadata: T | None = None
     ) -> None: ...
+    async def bulk_link(self, edges: List[tuple]) -> None: ...
     async def unlink(self, source: str, target: str, label: str) -> None: ...
     async def linked(self, source: str, target: str, label: str) -> bool: ...
     async def get(self, source: str, target: str, label: str) -> Edge[T]: ...
     def children(self, source: str, label: str | None = None) -> AsyncIterator[str]: ...
     def parents(self, target: str, label: str | None = None) -> AsyncIterator[str]: ...
+    async def traverse(
+        self, source: str, label: str | None = None, depth: int = 1
+    ) -> list[str]: ...
     def edges(
         self, source: str, label: str | None = None
     ) -> AsyncIterator[Edge[T]]: ...
@@ -402,11 +406,15 @@ class IBeaverGraph[T: BaseModel](Protocol):
     def link(
         self, source: str, target: str, label: str, metadata: T | None = None
     ) -> None: ...
+    def bulk_link(self, edges: List[tuple]) -> None: ...
     def unlink(self, source: str, target: str, label: str) -> None: ...
     def linked(self, source: str, target: str, label: str) -> bool: ...
     def get(self, source: str, target: str, label: str) -> Edge[T]: ...
     def children(self, source: str, label: str | None = None) -> Iterator[str]: ...
     def parents(self, target: str, label: str | None = None) -> Iterator[str]: ...
+    def traverse(
+        self, source: str, label: str | None = None, depth: int = 1
+    ) -> list[str]: ...
     def edges(self, source: str, label: str | None = None) -> Iterator[Edge[T]]: ...
     def count(self) -> int: ...
     def clear(self) -> None: ...
@@ -423,10 +431,12 @@ class IAsyncBeaverList[T: BaseModel](Protocol):
     async def count(self) -> int: ...
     async def contains(self, value: T) -> bool: ...
     async def push(self, value: T) -> None: ...
+    async def extend(self, values: List[T]) -> None: ...
     async def prepend(self, value: T) -> None: ...
     async def insert(self, index: int, value: T) -> None: ...
     async def pop(self) -> T | None: ...
     async def deque(self) -> T | None: ...
+    async def popmany(self, count: int) -> List[T]: ...
     async def clear(self) -> None: ...
     async def dump(self, fp: IO[str] | None = None) -> dict | None: ...
     async def load(
@@ -446,10 +456,12 @@ class IBeaverList[T: BaseModel](Protocol):
     def delete(self, index: int) -> None: ...
     def count(self) -> int: ...
     def push(self, value: T) -> None: ...
+    def extend(self, values: List[T]) -> None: ...
     def prepend(self, value: T) -> None: ...
     def insert(self, index: int, value: T) -> None: ...
     def pop(self) -> T | None: ...
     def deque(self) -> T | None: ...
+    def popmany(self, count: int) -> List[T]: ...
     def clear(self) -> None: ...
     def dump(self, fp: IO[str] | None = None) -> dict | None: ...
     def load(
@@ -515,6 +527,13 @@ class IAsyncBeaverLog[T: BaseModel](Protocol):
         limit: int | None = None,
     ) -> list[LogEntry[T]]: ...
     def live(self, poll_interval: float = 0.1) -> AsyncIterator[LogEntry[T]]: ...
+    def live_aggregate(
+        self,
+        fn: str,
+        field: str | None = None,
+        window: float = 60.0,
+        period: float = 1.0,
+    ) -> AsyncIterator[float | None]: ...
     async def count(self) -> int: ...
     async def clear(self) -> None: ...
     async def dump(self, fp: IO[str] | None = None) -> dict | None: ...
@@ -537,6 +556,13 @@ class IBeaverLog[T: BaseModel](Protocol):
         limit: int | None = None,
     ) -> list[LogEntry[T]]: ...
     def live(self, poll_interval: float = 0.1) -> Iterator[LogEntry[T]]: ...
+    def live_aggregate(
+        self,
+        fn: str,
+        field: str | None = None,
+        window: float = 60.0,
+        period: float = 1.0,
+    ) -> Iterator[float | None]: ...
     def count(self) -> int: ...
     def clear(self) -> None: ...
     def dump(self, fp: IO[str] | None = None) -> dict | None: ...
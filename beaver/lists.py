@@ -97,22 +97,148 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
     Refactored for Async-First architecture (v2.0).
     """
 
-    async def _iter_dump_items(self):
-        async for item in self:
-            item_value = item
-            if self._model and isinstance(item, BaseModel):
-                item_value = json.loads(item.model_dump_json())
-            yield item_value
+    # Positional lookups shared by get/set/delete/insert. Kept as fixed text so
+    # every call hits the same entry in sqlite3's prepared-statement cache.
+    # The OFFSET walk only touches the (list_name, item_order) primary-key
+    # index, which also carries the rowid; the value lookup resolves that rowid
+    # first so the table row is read once instead of per skipped entry.
+    # Keyed by "counting from the end", so negative indices walk the index
+    # backwards instead of needing the list length first.
+    _SQL_ROWID_AT = {
+        False: "SELECT rowid FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC LIMIT 1 OFFSET ?",
+        True: "SELECT rowid FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order DESC LIMIT 1 OFFSET ?",
+    }
+    _SQL_VALUE_AT = {
+        False: f"SELECT item_value FROM __beaver_lists__ WHERE rowid = ({_SQL_ROWID_AT[False]})",
+        True: f"SELECT item_value FROM __beaver_lists__ WHERE rowid = ({_SQL_ROWID_AT[True]})",
+    }
+    # set/delete resolve the position and write in one statement; rowcount
+    # tells whether the index existed.
+    _SQL_UPDATE_AT = {
+        False: f"UPDATE __beaver_lists__ SET item_value = ? WHERE rowid = ({_SQL_ROWID_AT[False]})",
+        True: f"UPDATE __beaver_lists__ SET item_value = ? WHERE rowid = ({_SQL_ROWID_AT[True]})",
+    }
+    _SQL_DELETE_AT = {
+        False: f"DELETE FROM __beaver_lists__ WHERE rowid = ({_SQL_ROWID_AT[False]})",
+        True: f"DELETE FROM __beaver_lists__ WHERE rowid = ({_SQL_ROWID_AT[True]})",
+    }
+    # Mid-list insert: both neighbours come from one positional scan and the
+    # new key is minted between them in the same statement. Past the end the
+    # scan finds fewer than two keys and nothing is inserted.
+    _SQL_INSERT_AT = """
+        INSERT INTO __beaver_lists__ (list_name, item_order, item_value)
+        SELECT ?, beaver_key_between(lo, hi), ?
+        FROM (
+            SELECT MIN(item_order) AS lo, MAX(item_order) AS hi, COUNT(*) AS n
+            FROM (
+                SELECT item_order FROM __beaver_lists__ WHERE list_name = ?
+                ORDER BY item_order ASC LIMIT 2 OFFSET ?
+            )
+        )
+        WHERE n = 2
+    """
+    _SQL_INSERT = "INSERT INTO __beaver_lists__ (list_name, item_order, item_value) VALUES (?, ?, ?)"
+
+    # End inserts read the boundary key and mint the next one in a single
+    # statement; beaver_key_between is key_between, registered on connect.
+    _SQL_PUSH = """
+        INSERT INTO __beaver_lists__ (list_name, item_order, item_value)
+        SELECT ?, beaver_key_between(MAX(item_order), NULL), ?
+        FROM __beaver_lists__ WHERE list_name = ?
+    """
+    _SQL_PREPEND = """
+        INSERT INTO __beaver_lists__ (list_name, item_order, item_value)
+        SELECT ?, beaver_key_between(NULL, MIN(item_order)), ?
+        FROM __beaver_lists__ WHERE list_name = ?
+    """
 
-    async def _get_dump_object(self) -> dict:
-        items = [item async for item in self._iter_dump_items()]
-        metadata = {
+    # Rows fetched per worker-thread hop when iterating.
+    _ITER_CHUNK = 1000
+    _SQL_ITER = "SELECT item_value FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC"
+
+    # Select-and-delete of an end item in one statement (SQLite >= 3.35).
+    _SQL_POP = """
+        DELETE FROM __beaver_lists__ WHERE rowid = (
+            SELECT rowid FROM __beaver_lists__ WHERE list_name = ?
+            ORDER BY item_order DESC LIMIT 1
+        ) RETURNING item_value
+    """
+    _SQL_DEQUE = """
+        DELETE FROM __beaver_lists__ WHERE rowid = (
+            SELECT rowid FROM __beaver_lists__ WHERE list_name = ?
+            ORDER BY item_order ASC LIMIT 1
+        ) RETURNING item_value
+    """
+    # RETURNING order is unspecified, so the keys come back for sorting.
+    _SQL_POPMANY = """
+        DELETE FROM __beaver_lists__ WHERE rowid IN (
+            SELECT rowid FROM __beaver_lists__ WHERE list_name = ?
+            ORDER BY item_order DESC LIMIT ?
+        ) RETURNING item_order, item_value
+    """
+
+    def _dump_metadata(self, count: int) -> dict:
+        return {
             "type": "List",
             "name": self._name,
-            "count": len(items),
+            "count": count,
             "dump_date": datetime.now(timezone.utc).isoformat(),
         }
-        return {"metadata": metadata, "items": items}
+
+    async def _get_dump_object(self) -> dict:
+        # The stored text already is each item's JSON form, so splice it into
+        # one array and parse once instead of validating every row into a model
+        # only to dump it back out.
+        parts = [raw async for raw in self._iter_stored_json()]
+        items = self._decode_json("[" + ",".join(parts) + "]")
+        return {"metadata": self._dump_metadata(len(items)), "items": items}
+
+    async def _iter_stored_json(self):
+        """Yields each item's stored JSON text, in list order."""
+        cursor = await self.connection.execute(self._SQL_ITER, (self._name,))
+        cursor.row_factory = None
+        while rows := await cursor.fetchmany(self._ITER_CHUNK):
+            for row in rows:
+                yield row[0]
+
+    async def _iter_ascii_json(self):
+        """Stored JSON for verbatim dumps, re-encoded where it isn't ASCII
+        (model_dump_json writes raw UTF-8; json.dumps writes escapes)."""
+        async for raw in self._iter_stored_json():
+            yield (
+                raw
+                if raw.isascii()
+                else self._encode_dump(self._decode_json(raw), None)
+            )
+
+    async def _write_json_dump(self, fp: IO[str], indent: int | None):
+        """
+        Writes the document _get_dump_object() describes, but one item at a
+        time, straight from the stored JSON, so memory stays at one fetch
+        chunk instead of the whole list. Nested fragments are re-indented by
+        prefixing their line breaks; JSON strings never contain a raw newline.
+        """
+        metadata = self._encode_dump(self._dump_metadata(await self.count()), indent)
+        if indent is None:
+            fp.write('{"metadata":' + metadata + ',"items":[')
+            separator = ""
+            async for raw in self._iter_ascii_json():
+                fp.write(separator + raw)
+                separator = ","
+            fp.write("]}")
+            return
+
+        outer = "\n" + " " * indent
+        inner = outer + " " * indent
+        fp.write("{" + outer + '"metadata": ')
+        fp.write(metadata.replace("\n", outer))
+        fp.write("," + outer + '"items": [')
+        separator = ""
+        async for raw in self._iter_stored_json():
+            item = self._encode_dump(self._decode_json(raw), indent)
+            fp.write(separator + inner + item.replace("\n", inner))
+            separator = ","
+        fp.write((outer if separator else "") + "]\n}")
 
     @local_only(
         "list.dump() is only available on local databases (no chunked transfer yet)"
@@ -125,17 +251,16 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
     ) -> dict | None:
         if format == "json":
             async with self:
-                dump_object = await self._get_dump_object()
-            if fp:
-                json.dump(dump_object, fp, indent=indent)
-                return None
-            return dump_object
+                if fp:
+                    await self._write_json_dump(fp, indent)
+                    return None
+                return await self._get_dump_object()
         if format == "jsonl":
             if fp is None:
                 raise ValueError("JSONL format requires fp.")
             async with self:
-                async for item in self._iter_dump_items():
-                    fp.write(json.dumps(item) + "\n")
+                async for raw in self._iter_ascii_json():
+                    fp.write(raw + "\n")
             return None
         raise ValueError(f"Unsupported format: {format!r}. Use 'json' or 'jsonl'.")
 
@@ -195,13 +320,38 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
         row = await cursor.fetchone()
         return row[0] if row else 0
 
+    @staticmethod
+    def _locate(index: int) -> tuple[bool, int]:
+        """Maps a Python index to (from_end, offset) for the positional queries."""
+        if index < 0:
+            return True, -index - 1
+        return False, index
+
+    @atomic
+    async def _get_slice(self, index: slice) -> list[T]:
+        """Reads a slice; atomic so the length and the rows agree."""
+        start, stop, step = index.indices(await self.count())
+
+        if step != 1:
+            raise ValueError("Slicing with a step is not supported.")
+
+        limit = stop - start
+        if limit <= 0:
+            return []
+
+        cursor = await self.connection.execute(
+            "SELECT item_value FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC LIMIT ? OFFSET ?",
+            (self._name, limit, start),
+        )
+        rows = await cursor.fetchall()
+        return self._deserialize_many([row["item_value"] for row in rows])
+
     @expose(
         path="/item/{index}",
         method="GET",
         cli_name="get",
         cli_help="Retrieve an item at an index.",
     )
-    @atomic
     async def get(self, index: Union[int, slice]) -> T | list[T]:
         """
         Retrieves an item or slice from the list.
@@ -209,39 +359,17 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
         """
         # Handle Slice
         if isinstance(index, slice):
-            # We need the length to calculate indices
-            list_len = await self.count()
-            start, stop, step = index.indices(list_len)
+            return await self._get_slice(index)
 
-            if step != 1:
-                raise ValueError("Slicing with a step is not supported.")
-
-            limit = stop - start
-            if limit <= 0:
-                return []
-
-            cursor = await self.connection.execute(
-                "SELECT item_value FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC LIMIT ? OFFSET ?",
-                (self._name, limit, start),
-            )
-            results = [
-                self._deserialize(row["item_value"]) for row in await cursor.fetchall()
-            ]
-            return results
-
-        # Handle Integer
+        # Handle Integer: a single SELECT, held just between transactions
+        # instead of opening one of its own.
         elif isinstance(index, int):
-            list_len = await self.count()
-            if index < -list_len or index >= list_len:
-                raise IndexError("List index out of range.")
-
-            offset = index if index >= 0 else list_len + index
-
-            cursor = await self.connection.execute(
-                "SELECT item_value FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC LIMIT 1 OFFSET ?",
-                (self._name, offset),
-            )
-            result = await cursor.fetchone()
+            from_end, offset = self._locate(index)
+            async with self._db._committed_read():
+                rows = await self.connection.execute_fetchall(
+                    self._SQL_VALUE_AT[from_end], (self._name, offset)
+                )
+            result = next(iter(rows), None)
             if not result:
                 raise IndexError("List index out of range.")
 
@@ -267,28 +395,13 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
         if not isinstance(index, int):
             raise TypeError("List indices must be integers.")
 
-        list_len = await self.count()
-        if index < -list_len or index >= list_len:
-            raise IndexError("List index out of range.")
-
-        offset = index if index >= 0 else list_len + index
-
-        # Find the rowid of the item to update
+        from_end, offset = self._locate(index)
         cursor = await self.connection.execute(
-            "SELECT rowid FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC LIMIT 1 OFFSET ?",
-            (self._name, offset),
-        )
-        result = await cursor.fetchone()
-        if not result:
-            raise IndexError("List index out of range during update.")
-
-        rowid_to_update = result["rowid"]
-
-        # Update the value
-        await self.connection.execute(
-            "UPDATE __beaver_lists__ SET item_value = ? WHERE rowid = ?",
-            (self._serialize(value), rowid_to_update),
+            self._SQL_UPDATE_AT[from_end],
+            (self._serialize(value), self._name, offset),
         )
+        if cursor.rowcount == 0:
+            raise IndexError("List index out of range.")
 
     @expose(
         path="/item/{index}",
@@ -306,37 +419,26 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
         if not isinstance(index, int):
             raise TypeError("List indices must be integers.")
 
-        list_len = await self.count()
-        if index < -list_len or index >= list_len:
-            raise IndexError("List index out of range.")
-
-        offset = index if index >= 0 else list_len + index
-
-        # Find rowid
+        from_end, offset = self._locate(index)
         cursor = await self.connection.execute(
-            "SELECT rowid FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC LIMIT 1 OFFSET ?",
-            (self._name, offset),
-        )
-        result = await cursor.fetchone()
-        if not result:
-            raise IndexError("List index out of range during delete.")
-
-        rowid_to_delete = result["rowid"]
-
-        await self.connection.execute(
-            "DELETE FROM __beaver_lists__ WHERE rowid = ?", (rowid_to_delete,)
+            self._SQL_DELETE_AT[from_end], (self._name, offset)
         )
+        if cursor.rowcount == 0:
+            raise IndexError("List index out of range.")
 
     # --- Iterators ---
 
     async def __aiter__(self):
         """Async iterator for the list."""
-        cursor = await self.connection.execute(
-            "SELECT item_value FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC",
-            (self._name,),
-        )
-        async for row in cursor:
-            yield self._deserialize(row["item_value"])
+        cursor = await self.connection.execute(self._SQL_ITER, (self._name,))
+        # Full scans read one column by position; plain tuples skip building
+        # an sqlite3.Row per item.
+        cursor.row_factory = None
+        # Pull rows in large chunks: one worker-thread hop and one parse per
+        # chunk is cheaper than aiosqlite's per-row async iterator.
+        while rows := await cursor.fetchmany(self._ITER_CHUNK):
+            for item in self._deserialize_many([row[0] for row in rows]):
+                yield item
 
     @expose(
         path="/contains",
@@ -345,7 +447,10 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
         cli_help="Check if an item exists.",
     )
     async def contains(self, value: T) -> bool:
-        """Checks for existence of an item."""
+        """
+        Checks for existence of an item. Scans the whole list unless the
+        database was opened with index_list_values=True, which makes it a seek.
+        """
         serialized = self._serialize(value)
         cursor = await self.connection.execute(
             "SELECT 1 FROM __beaver_lists__ WHERE list_name = ? AND item_value = ? LIMIT 1",
@@ -353,18 +458,6 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
         )
         return await cursor.fetchone() is not None
 
-    async def _get_key_at_index(self, index: int) -> str:
-        """Helper to get the item_order string key at a specific index."""
-        cursor = await self.connection.execute(
-            "SELECT item_order FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC LIMIT 1 OFFSET ?",
-            (self._name, index),
-        )
-        result = await cursor.fetchone()
-
-        if result:
-            return result[0]
-        raise IndexError(f"{index} out of range.")
-
     @expose(
         path="/push",
         method="POST",
@@ -376,17 +469,8 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
     @atomic
     async def push(self, value: T):
         """Pushes an item to the end of the list."""
-        cursor = await self.connection.execute(
-            "SELECT MAX(item_order) FROM __beaver_lists__ WHERE list_name = ?",
-            (self._name,),
-        )
-        row = await cursor.fetchone()
-        max_key = row[0] if row and row[0] is not None else None
-        new_key = key_between(max_key, None)
-
         await self.connection.execute(
-            "INSERT INTO __beaver_lists__ (list_name, item_order, item_value) VALUES (?, ?, ?)",
-            (self._name, new_key, self._serialize(value)),
+            self._SQL_PUSH, (self._name, self._serialize(value), self._name)
         )
 
     @expose(
@@ -400,18 +484,40 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
     @atomic
     async def prepend(self, value: T):
         """Prepends an item to the beginning of the list."""
+        await self.connection.execute(
+            self._SQL_PREPEND, (self._name, self._serialize(value), self._name)
+        )
+
+    @expose(
+        path="/extend",
+        method="POST",
+        cli_name="extend",
+        cli_help="Push every item of a JSON array to the end.",
+        body_param="values",
+    )
+    @emits("extend", payload=lambda values, *args, **kwargs: dict(count=len(values)))
+    @atomic
+    async def extend(self, values: list[T]):
+        """
+        Pushes many items to the end of the list in one transaction.
+        Reads MAX(item_order) once and inserts every row in one executemany.
+        """
+        if not values:
+            return
+
         cursor = await self.connection.execute(
-            "SELECT MIN(item_order) FROM __beaver_lists__ WHERE list_name = ?",
+            "SELECT MAX(item_order) FROM __beaver_lists__ WHERE list_name = ?",
             (self._name,),
         )
         row = await cursor.fetchone()
-        min_key = row[0] if row and row[0] is not None else None
-        new_key = key_between(None, min_key)
+        prev = row[0] if row and row[0] is not None else None
 
-        await self.connection.execute(
-            "INSERT INTO __beaver_lists__ (list_name, item_order, item_value) VALUES (?, ?, ?)",
-            (self._name, new_key, self._serialize(value)),
-        )
+        rows = []
+        for value in values:
+            prev = key_between(prev, None)
+            rows.append((self._name, prev, self._serialize(value)))
+
+        await self.connection.executemany(self._SQL_INSERT, rows)
 
     @expose(
         path="/insert/{index}",
@@ -424,23 +530,19 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
     @atomic
     async def insert(self, index: int, value: T):
         """Inserts an item at a specific index using fractional-index ordering."""
-        list_len = await self.count()
-
         if index <= 0:
             await self.prepend(value)
             return
-        if index >= list_len:
-            await self.push(value)
-            return
 
-        left_key = await self._get_key_at_index(index - 1)
-        right_key = await self._get_key_at_index(index)
-        new_key = key_between(left_key, right_key)
-
-        await self.connection.execute(
-            "INSERT INTO __beaver_lists__ (list_name, item_order, item_value) VALUES (?, ?, ?)",
-            (self._name, new_key, self._serialize(value)),
+        serialized = self._serialize(value)
+        cursor = await self.connection.execute(
+            self._SQL_INSERT_AT, (self._name, serialized, self._name, index - 1)
         )
+        if cursor.rowcount == 0:
+            # Fewer than two keys at the position: the index is past the end.
+            await self.connection.execute(
+                self._SQL_PUSH, (self._name, serialized, self._name)
+            )
 
     @expose(
         path="/pop",
@@ -452,19 +554,12 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
     @atomic
     async def pop(self) -> T | None:
         """Removes and returns the last item."""
-        cursor = await self.connection.execute(
-            "SELECT rowid, item_value FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order DESC LIMIT 1",
-            (self._name,),
-        )
-        result = await cursor.fetchone()
-        if not result:
+        cursor = await self.connection.execute(self._SQL_POP, (self._name,))
+        row = await cursor.fetchone()
+        if row is None:
             return None
 
-        rowid_to_delete, value_to_return = result
-        await self.connection.execute(
-            "DELETE FROM __beaver_lists__ WHERE rowid = ?", (rowid_to_delete,)
-        )
-        return self._deserialize(value_to_return)
+        return self._deserialize(row[0])
 
     @expose(
         path="/deque",
@@ -476,19 +571,33 @@ class AsyncBeaverList[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverList[T]):
     @atomic
     async def deque(self) -> T | None:
         """Removes and returns the first item."""
-        cursor = await self.connection.execute(
-            "SELECT rowid, item_value FROM __beaver_lists__ WHERE list_name = ? ORDER BY item_order ASC LIMIT 1",
-            (self._name,),
-        )
-        result = await cursor.fetchone()
-        if not result:
+        cursor = await self.connection.execute(self._SQL_DEQUE, (self._name,))
+        row = await cursor.fetchone()
+        if row is None:
             return None
 
-        rowid_to_delete, value_to_return = result
-        await self.connection.execute(
-            "DELETE FROM __beaver_lists__ WHERE rowid = ?", (rowid_to_delete,)
-        )
-        return self._deserialize(value_to_return)
+        return self._deserialize(row[0])
+
+    @expose(
+        path="/popmany",
+        method="POST",
+        cli_name="popmany",
+        cli_help="Remove and return up to COUNT items from the end.",
+    )
+    @emits("popmany", payload=lambda count, *args, **kwargs: dict(count=count))
+    @atomic
+    async def popmany(self, count: int) -> list[T]:
+        """
+        Removes and returns up to `count` items from the end, last item first,
+        in a single statement. Returns fewer items if the list is shorter.
+        """
+        if count < 0:
+            raise ValueError("count must be non-negative.")
+
+        cursor = await self.connection.execute(self._SQL_POPMANY, (self._name, count))
+        rows = list(await cursor.fetchall())
+        rows.sort(key=lambda row: row[0], reverse=True)
+        return self._deserialize_many([row[1] for row in rows])
 
     @expose(path="/clear", method="POST", cli_name="clear", cli_help="Clear all items.")
     @emits("clear", payload=lambda *args, **kwargs: dict())
@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import random
 import time
 import os
@@ -11,7 +12,54 @@ if TYPE_CHECKING:
     from .core import AsyncBeaverDB
 
 
+# Waiter ids are a per-process tag plus a counter: unique across processes
+# without drawing a fresh uuid4 for every lock object.
+def _new_process_tag() -> str:
+    return f"pid:{os.getpid()}:id:{uuid.uuid4().hex}"
+
+
+_process_tag = _new_process_tag()
+_waiter_ids = itertools.count()
+
+
+def _reset_waiter_ids():
+    # A forked child must not reuse its parent's tag and counter.
+    global _process_tag, _waiter_ids
+    _process_tag = _new_process_tag()
+    _waiter_ids = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_waiter_ids)
+
+
 class AsyncBeaverLock(IAsyncBeaverLock):
+    # One poll reads the queue head, whether we are still queued and whether
+    # any waiter has expired in a single plain read. Only an expired waiter
+    # needs the write lock (to sweep it), so idle waiters never queue behind
+    # writers. Every lookup carries lock_name so it seeks a (lock_name, ...)
+    # index instead of scanning every lock.
+    _SQL_SWEEP = (
+        "DELETE FROM __beaver_lock_waiters__ WHERE lock_name = ? AND expires_at < ?"
+    )
+    _SQL_POLL = """
+        SELECT
+            (SELECT waiter_id FROM __beaver_lock_waiters__
+             WHERE lock_name = ?
+             ORDER BY requested_at ASC, rowid ASC
+             LIMIT 1) AS head,
+            EXISTS (SELECT 1 FROM __beaver_lock_waiters__
+                    WHERE lock_name = ? AND waiter_id = ?) AS queued,
+            EXISTS (SELECT 1 FROM __beaver_lock_waiters__
+                    WHERE lock_name = ? AND expires_at < ?) AS expired
+    """
+
+    # Holders in this process wake local waiters directly when they leave the
+    # queue. Polling only has to notice other processes: waits start at this
+    # fraction of poll_interval and double up to it, so short hand-offs are
+    # noticed quickly without hammering long waits.
+    _FIRST_WAIT_FRACTION = 0.125
+
     def __init__(
         self,
         db: "AsyncBeaverDB",
@@ -27,7 +75,7 @@ class AsyncBeaverLock(IAsyncBeaverLock):
         self._timeout = timeout
         self._lock_ttl = lock_ttl
         self._poll_interval = poll_interval
-        self._waiter_id = f"pid:{os.getpid()}:id:{uuid.uuid4()}"
+        self._waiter_id = f"{_process_tag}:{next(_waiter_ids)}"
         self._acquired = False
 
     async def renew(self, lock_ttl: Optional[float] = None) -> bool:
@@ -51,7 +99,7 @@ class AsyncBeaverLock(IAsyncBeaverLock):
                 (self._lock_name,),
             )
             count = cursor.rowcount
-
+            self._wake_after_commit()
         self._acquired = False
         return count > 0
 
@@ -71,8 +119,12 @@ class AsyncBeaverLock(IAsyncBeaverLock):
             poll_interval if poll_interval is not None else self._poll_interval
         )
 
-        start_time = time.time()
+        # Elapsed time uses the monotonic clock so wall-clock steps cannot cut
+        # a wait short or stretch it; the stored timestamps stay wall-clock
+        # because other processes compare them.
+        start_time = time.monotonic()
         requested_at = time.time()
+        wake = asyncio.Event()
         expires_at = requested_at + current_lock_ttl
 
         try:
@@ -88,41 +140,36 @@ class AsyncBeaverLock(IAsyncBeaverLock):
                 )
 
             # 2. Start Polling Loop
+            self._db._watch_lock(self._lock_name, wake)
+            wait = current_poll_interval * self._FIRST_WAIT_FRACTION
             while True:
-                async with self._db.transaction():
-                    # A. Clean up expired locks from crashed processes
-                    now = time.time()
-                    await self._db.connection.execute(
-                        "DELETE FROM __beaver_lock_waiters__ WHERE lock_name = ? AND expires_at < ?",
-                        (self._lock_name, now),
-                    )
-
-                    # B. Check who is at the front of the queue
-                    cursor = await self._db.connection.execute(
-                        """
-                        SELECT waiter_id FROM __beaver_lock_waiters__
-                        WHERE lock_name = ?
-                        ORDER BY requested_at ASC, rowid ASC
-                        LIMIT 1
-                        """,
-                        (self._lock_name,),
-                    )
-                    result = await cursor.fetchone()
-
-                    # C. Sanity Check: Ensure we are still in the queue
-                    check_self = await self._db.connection.execute(
-                        "SELECT 1 FROM __beaver_lock_waiters__ WHERE waiter_id = ?",
-                        (self._waiter_id,),
-                    )
-                    if not await check_self.fetchone():
-                        return False  # We were deleted (cleared or expired)
-
-                    if result and result["waiter_id"] == self._waiter_id:
-                        self._acquired = True
-                        return True
+                # Cleared before polling, so a release that lands between the
+                # poll and the wait below still wakes us.
+                wake.clear()
+
+                # A. Check who is at the front of the queue, that we are
+                # still in it, and whether anyone has expired
+                result = await self._poll()
+
+                if result["expired"]:
+                    # B. Clean up expired locks from crashed processes, then
+                    # look again under the same write transaction
+                    async with self._db.transaction():
+                        await self._db.connection.execute(
+                            self._SQL_SWEEP, (self._lock_name, time.time())
+                        )
+                        result = await self._poll()
+                        self._wake_after_commit()
+
+                if not result["queued"]:
+                    return False  # We were deleted (cleared or expired)
+
+                if result["head"] == self._waiter_id:
+                    self._acquired = True
+                    return True
 
                 # 3. Check for timeout or non-blocking return
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 if current_timeout is not None and elapsed > current_timeout:
                     await self._release_from_queue()
                     return False
@@ -131,17 +178,39 @@ class AsyncBeaverLock(IAsyncBeaverLock):
                     await self._release_from_queue()
                     return False
 
-                # 4. Wait safely
-                jitter = current_poll_interval * 0.1
-                sleep_time = random.uniform(
-                    current_poll_interval - jitter, current_poll_interval + jitter
-                )
-                await asyncio.sleep(sleep_time)
+                # 4. Wait for a local hand-off, or poll again after backing
+                # off towards poll_interval
+                jitter = wait * 0.1
+                try:
+                    await asyncio.wait_for(
+                        wake.wait(), random.uniform(wait - jitter, wait + jitter)
+                    )
+                except TimeoutError:
+                    wait = min(wait * 2, current_poll_interval)
 
         except Exception:
             await self._release_from_queue()
             raise
 
+        finally:
+            self._db._unwatch_lock(self._lock_name, wake)
+
+    async def _poll(self):
+        # Only committed queue rows count: a release inside another task's
+        # transaction must not hand us the lock before it commits.
+        async with self._db._committed_read():
+            cursor = await self._db.connection.execute(
+                self._SQL_POLL,
+                (
+                    self._lock_name,
+                    self._lock_name,
+                    self._waiter_id,
+                    self._lock_name,
+                    time.time(),
+                ),
+            )
+            return await cursor.fetchone()
+
     async def _release_from_queue(self):
         try:
             async with self._db.transaction():
@@ -149,9 +218,17 @@ class AsyncBeaverLock(IAsyncBeaverLock):
                     "DELETE FROM __beaver_lock_waiters__ WHERE lock_name = ? AND waiter_id = ?",
                     (self._lock_name, self._waiter_id),
                 )
+                self._wake_after_commit()
         except Exception:
             pass
 
+    def _wake_after_commit(self):
+        # Waiters woken before the queue change commits would poll the old
+        # queue, or, inside an outer transaction, one that may roll back.
+        self._db._call_after_commit(
+            lambda: self._db._wake_lock_waiters(self._lock_name)
+        )
+
     async def release(self):
         if not self._acquired:
             return
@@ -9,6 +9,7 @@ from typing import (
     Protocol,
     runtime_checkable,
     NamedTuple,
+    TYPE_CHECKING,
 )
 
 from pydantic import BaseModel
@@ -18,6 +19,13 @@ from .api import expose, local_only
 from .manager import AsyncBeaverBase, atomic, emits
 from .interfaces import LogEntry, IAsyncBeaverLog
 
+if TYPE_CHECKING:
+    from .core import AsyncBeaverDB
+
+
+class _LogCallerCancelled(Exception):
+    """A coalesced log() caller gave up before its entry was committed."""
+
 
 class AsyncLogBatch[T: BaseModel]:
     """Async context manager for buffered bulk appends to a log.
@@ -60,8 +68,7 @@ class AsyncLogBatch[T: BaseModel]:
         async with self._manager._internal_lock:
             async with self._manager._db.transaction():
                 await self._manager.connection.executemany(
-                    "INSERT INTO __beaver_logs__ (log_name, timestamp, data) VALUES (?, ?, ?)",
-                    self._pending,
+                    self._manager._SQL_INSERT, self._pending
                 )
                 mgr = self._manager
                 if mgr._indexed:
@@ -75,6 +82,7 @@ class AsyncLogBatch[T: BaseModel]:
                             item,
                             mgr._indexed,
                         )
+        self._manager._db._wake_log_tails(self._manager._name)
         self._pending.clear()
         self._pending_items.clear()
 
@@ -87,6 +95,47 @@ class AsyncBeaverLog[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverLog[T]):
 
     _INDEX_KIND = "log"
 
+    _RANGE_CHUNK = 1000
+
+    # Fixed strings so every call hits the connection's statement cache.
+    _SQL_INSERT = (
+        "INSERT INTO __beaver_logs__ (log_name, timestamp, data) VALUES (?, ?, ?)"
+    )
+    _SQL_TAIL = (
+        "SELECT timestamp, data FROM __beaver_logs__ "
+        "WHERE log_name = ? AND timestamp > ? ORDER BY timestamp ASC"
+    )
+    _AGGREGATES = {
+        "count": "COUNT",
+        "sum": "SUM",
+        "avg": "AVG",
+        "min": "MIN",
+        "max": "MAX",
+    }
+    _SQL_WINDOW_AGGREGATE = (
+        "SELECT {fn}(json_extract(data, ?)) FROM __beaver_logs__ "
+        "WHERE log_name = ? AND timestamp >= ?"
+    )
+    _SQL_WINDOW_COUNT = (
+        "SELECT COUNT(*) FROM __beaver_logs__ WHERE log_name = ? AND timestamp >= ?"
+    )
+
+    def __init__(
+        self,
+        name: str,
+        db: "AsyncBeaverDB",
+        model: type[T] | None = None,
+        indexed: list[str] | None = None,
+    ):
+        super().__init__(name, db, model, indexed)
+        # Entries from concurrent log() calls waiting for the flusher:
+        # (timestamp, serialized, data, future resolved once committed).
+        self._log_queue: list[tuple[float, str, T, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+        self._log_writing = False
+        # Last clock-assigned timestamp; explicit ones (backfills) don't move it.
+        self._last_auto_ts = 0.0
+
     @staticmethod
     def _item_key(ts: float) -> str:
         """repr() round-trips a float exactly; SQLite's CAST(x AS TEXT) does
@@ -117,21 +166,126 @@ class AsyncBeaverLog[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverLog[T]):
         body_param="data",
     )
     @emits("log", payload=lambda data, *args, **kwargs: dict(data=data))
-    @atomic
     async def log(self, data: T, timestamp: float | None = None):
         """
         Appends an entry to the log.
         Ensures timestamp uniqueness (PK constraint) by micro-incrementing on collision.
+
+        Calls from concurrent tasks are coalesced: entries that arrive while
+        another write is in flight are queued, and one flusher commits all of
+        them in a single transaction. Each call returns once its own entry is
+        committed.
         """
-        ts = timestamp or time.time()
+        if timestamp:
+            ts = timestamp
+        else:
+            # Clock reads can repeat under bursts (coarse clocks especially);
+            # step past the last one instead of colliding on the primary key.
+            ts = max(time.time(), self._last_auto_ts + 1e-6)
+            self._last_auto_ts = ts
         serialized_data = self._serialize(data)
 
-        # Retry loop to handle PK collisions (same microsecond)
+        if self._db._tx_owner_task is asyncio.current_task():
+            # Already inside this task's transaction: the flusher would wait on
+            # it forever, so write in place and let the caller commit.
+            await self._append(ts, serialized_data, data)
+            self._db._call_after_commit(lambda: self._db._wake_log_tails(self._name))
+            return
+
+        if self._flush_task is None and not self._log_writing:
+            # Nothing in flight: commit directly. Calls arriving meanwhile
+            # queue up for the flusher started on the way out.
+            self._log_writing = True
+            try:
+                async with self._internal_lock:
+                    async with self._db.transaction():
+                        await self._append(ts, serialized_data, data)
+                self._db._wake_log_tails(self._name)
+            finally:
+                self._log_writing = False
+                self._start_log_flush()
+            return
+
+        committed = asyncio.get_running_loop().create_future()
+        self._log_queue.append((ts, serialized_data, data, committed))
+        self._start_log_flush()
+        await committed
+
+    def _start_log_flush(self):
+        if self._log_queue and self._flush_task is None and not self._log_writing:
+            self._flush_task = asyncio.create_task(self._flush_log_queue())
+            self._flush_task.add_done_callback(self._log_flush_done)
+
+    def _log_flush_done(self, task: asyncio.Task):
+        # A flusher cancelled before its first step never runs its finally
+        # block; don't leave the queued callers waiting forever.
+        if self._flush_task is task:
+            self._flush_task = None
+            for *_, committed in self._log_queue:
+                committed.cancel()
+            self._log_queue = []
+
+    async def _commit_log_entries(self, entries: list) -> None:
+        async with self._internal_lock:
+            async with self._db.transaction():
+                for ts, serialized_data, data, _ in entries:
+                    await self._append(ts, serialized_data, data)
+                if any(committed.done() for *_, committed in entries):
+                    # A caller was cancelled while its entry was being
+                    # written. Roll back rather than commit it anyway.
+                    raise _LogCallerCancelled()
+
+    async def _flush_log_queue(self):
+        batch = []
+        try:
+            # Entries queued while a batch commits form the next batch.
+            while self._log_queue:
+                # Callers cancelled while queued are dropped, not written.
+                batch = [entry for entry in self._log_queue if not entry[3].done()]
+                self._log_queue = []
+                if not batch:
+                    continue
+                try:
+                    await self._commit_log_entries(batch)
+                except Exception:
+                    # The batch rolled back. Replay it one entry per
+                    # transaction so each caller gets its own outcome.
+                    for entry in batch:
+                        committed = entry[3]
+                        if committed.done():
+                            continue
+                        try:
+                            await self._commit_log_entries([entry])
+                        except _LogCallerCancelled:
+                            pass
+                        except Exception as e:
+                            if not committed.done():
+                                committed.set_exception(e)
+                        else:
+                            if not committed.done():
+                                committed.set_result(None)
+                else:
+                    for *_, committed in batch:
+                        if not committed.done():
+                            committed.set_result(None)
+                self._db._wake_log_tails(self._name)
+                batch = []
+        finally:
+            self._flush_task = None
+            # Only reached with entries pending if the flusher itself was
+            # cancelled; don't leave their callers waiting forever.
+            for *_, committed in batch + self._log_queue:
+                if not committed.done():
+                    committed.cancel()
+            self._log_queue = []
+
+    async def _append(self, ts: float, serialized_data: str, data: T):
+        # Retry loop to handle PK collisions: explicit timestamps, or another
+        # process writing the same microsecond
         while True:
             try:
                 await self.connection.execute(
-                    "INSERT INTO __beaver_logs__ (log_name, timestamp, data) VALUES (?, ?, ?)",
-                    (self._name, ts, serialized_data),
+                    self._SQL_INSERT, (self._name, ts, serialized_data)
                 )
                 break
             except sqlite3.IntegrityError:
@@ -214,12 +368,17 @@ class AsyncBeaverLog[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverLog[T]):
             params.append(offset)
 
         cursor = await self.connection.execute(query, tuple(params))
-        rows = await cursor.fetchall()
-
-        return [
-            LogEntry(timestamp=row["timestamp"], data=self._deserialize(row["data"]))
-            for row in rows
-        ]
+        cursor.row_factory = None
+        entries: list[LogEntry[T]] = []
+        # Chunked so a large range never holds all raw rows next to the
+        # entries built from them; each chunk is parsed in one call.
+        while rows := await cursor.fetchmany(self._RANGE_CHUNK):
+            values = self._deserialize_many([row[1] for row in rows])
+            entries.extend(
+                LogEntry(timestamp=row[0], data=value)
+                for row, value in zip(rows, values)
+            )
+        return entries
 
     @expose(
         path="/indexes",
@@ -296,31 +455,85 @@ class AsyncBeaverLog[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverLog[T]):
         """
         Yields new log entries as they are added in real-time.
         This is an infinite async generator.
+
+        Writes from this process wake the tail at once; `poll_interval` only
+        bounds how long entries written by other processes take to show up.
         """
         # Start trailing from "now"
         last_ts = time.time()
+        wake = asyncio.Event()
+        self._db._watch_log(self._name, wake)
+
+        try:
+            while True:
+                # Cleared before the poll, so a write landing during it still
+                # wakes the wait below.
+                wake.clear()
+                # One hop to the connection thread per poll, not two.
+                rows = await self.connection.execute_fetchall(
+                    self._SQL_TAIL, (self._name, last_ts)
+                )
 
-        while True:
-            # Poll for new items since last_ts
-            cursor = await self.connection.execute(
-                """
-                SELECT timestamp, data FROM __beaver_logs__
-                WHERE log_name = ? AND timestamp > ?
-                ORDER BY timestamp ASC
-                """,
-                (self._name, last_ts),
+                if rows:
+                    last_ts = rows[-1]["timestamp"]
+                    for row in rows:
+                        yield LogEntry(
+                            timestamp=row["timestamp"],
+                            data=self._deserialize(row["data"]),
+                        )
+
+                try:
+                    await asyncio.wait_for(wake.wait(), poll_interval)
+                except TimeoutError:
+                    pass
+        finally:
+            self._db._unwatch_log(self._name, wake)
+
+    @local_only(
+        "log.live_aggregate() is only available on local databases (infinite stream, no SSE yet)"
+    )
+    async def live_aggregate(
+        self,
+        fn: str,
+        field: str | None = None,
+        window: float = 60.0,
+        period: float = 1.0,
+    ) -> AsyncIterator[float | None]:
+        """
+        Yields an aggregate over the last `window` seconds every `period`.
+
+        `fn` is one of count, sum, avg, min or max and is computed by SQLite
+        over `json_extract(data, '$.<field>')`, so no row is shipped to Python
+        or deserialized. Without `field` the entry itself is aggregated (for
+        logs of plain numbers); `count` without `field` counts entries. Yields
+        None when the window holds no values. This is an infinite generator.
+        """
+        sql_fn = self._AGGREGATES.get(fn.lower())
+        if sql_fn is None:
+            raise ValueError(
+                f"fn must be one of {', '.join(self._AGGREGATES)}, got {fn!r}"
             )
-            rows = await cursor.fetchall()
+        if field is not None and self._model is not None:
+            head = field.split(".", 1)[0]
+            if head not in self._model.model_fields:
+                raise ValueError(
+                    f"{self._model.__name__} has no field {head!r} to aggregate"
+                )
 
-            if rows:
-                last_ts = rows[-1]["timestamp"]
-                for row in rows:
-                    yield LogEntry(
-                        timestamp=row["timestamp"], data=self._deserialize(row["data"])
-                    )
+        if sql_fn == "COUNT" and field is None:
+            query = self._SQL_WINDOW_COUNT
+            params: tuple = (self._name,)
+        else:
+            query = self._SQL_WINDOW_AGGREGATE.format(fn=sql_fn)
+            path = f"$.{field}" if field is not None else "$"
+            params = (path, self._name)
 
-            # Non-blocking sleep yields control to the event loop
-            await asyncio.sleep(poll_interval)
+        while True:
+            (row,) = await self.connection.execute_fetchall(
+                query, params + (time.time() - window,)
+            )
+            yield row[0]
+            await asyncio.sleep(period)
 
     @expose(
         path="/count",
@@ -353,7 +566,7 @@ class AsyncBeaverLog[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverLog[T]):
         for entry in entries:
             val = entry.data
             if self._model and isinstance(val, BaseModel):
-                val = json.loads(val.model_dump_json())
+                val = val.model_dump(mode="json")
             yield {"timestamp": entry.timestamp, "data": val}
 
     @local_only(
@@ -376,7 +589,7 @@ class AsyncBeaverLog[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverLog[T]):
                 "items": items_list,
             }
             if fp:
-                json.dump(dump_obj, fp, indent=indent)
+                fp.write(self._encode_dump(dump_obj, indent))
                 return None
             return dump_obj
         if format == "jsonl":
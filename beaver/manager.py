@@ -3,7 +3,8 @@ import functools
 from typing import Callable, Type, Optional, Self, Any, TYPE_CHECKING
 
 from aiosqlite import Connection
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import PydanticSerializationError, from_json, to_json
 
 from .locks import AsyncBeaverLock
 
@@ -14,6 +15,12 @@ if TYPE_CHECKING:
     from .events import AsyncBeaverEvents, EventHandler
 
 
+@functools.cache
+def _chunk_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Validator for a JSON array of `model`, built once per model class."""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]  # model is a runtime class
+
+
 class AsyncBeaverBase[T: BaseModel]:
     """
     Base class for async data managers.
@@ -105,7 +112,46 @@ class AsyncBeaverBase[T: BaseModel]:
         """Deserializes a JSON string (Sync CPU bound)."""
         if self._model:
             return self._model.model_validate_json(value)
-        return json.loads(value)
+        return self._decode_json(value)
+
+    def _deserialize_many(self, values: list[str]) -> list[T]:
+        """
+        Deserializes a batch of stored JSON strings with a single parse of the
+        spliced array, instead of one parser call per item.
+        """
+        if not values:
+            return []
+        array = "[" + ",".join(values) + "]"
+        if self._model:
+            return _chunk_adapter(self._model).validate_json(array)
+        return self._decode_json(array)
+
+    @staticmethod
+    def _encode_dump(obj: Any, indent: int | None) -> str:
+        """Encodes a dump document with pydantic-core's encoder (~12x faster).
+
+        Falls back to json.dumps, which dumps used before, when the fast
+        encoder refuses a value the db stores (lone surrogates) or writes
+        non-ASCII text, so a dump stays writable to an fp of any encoding.
+        """
+        try:
+            text = to_json(obj, indent=indent).decode()
+        except PydanticSerializationError:
+            text = None
+        if text is not None and text.isascii():
+            return text
+        separators = (",", ":") if indent is None else None
+        return json.dumps(obj, indent=indent, separators=separators)
+
+    @staticmethod
+    def _decode_json(text: str) -> Any:
+        """Parses stored JSON with pydantic-core's parser, which is ~2x faster."""
+        try:
+            return from_json(text)
+        except ValueError:
+            # json.dumps can write text the stricter parser refuses (e.g. lone
+            # surrogate escapes); the stdlib keeps those rows readable.
+            return json.loads(text)
 
     # --- Public Lock Interface ---
 
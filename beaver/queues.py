@@ -38,37 +38,36 @@ class AsyncBeaverQueue[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverQueue[T]):
             (self._name, priority, time.time(), self._serialize(data)),
         )
 
+    _SQL_PEEK = """
+        SELECT priority, timestamp, data
+        FROM __beaver_priority_queues__
+        WHERE queue_name = ?
+        ORDER BY priority ASC, timestamp ASC
+        LIMIT 1
+    """
+    # Select-and-delete of the head item in one statement (SQLite >= 3.35).
+    _SQL_POP = """
+        DELETE FROM __beaver_priority_queues__ WHERE rowid = (
+            SELECT rowid FROM __beaver_priority_queues__ WHERE queue_name = ?
+            ORDER BY priority ASC, timestamp ASC LIMIT 1
+        ) RETURNING priority, timestamp, data
+    """
+
     async def _get_item_atomically(self, pop: bool = True) -> QueueItem[T] | None:
         """
-        Performs a single, atomic attempt to retrieve and remove the
-        highest-priority item from the queue.
+        Performs a single, atomic attempt to retrieve (and, with pop=True,
+        remove) the highest-priority item from the queue.
         """
-        # We need a transaction to ensure we don't peek/get an item that someone else steals
-        # Note: If called from peek/get, they might handle locking via @atomic or logic.
-        # Since this helper is used inside @atomic methods, we just need execution.
-
+        # Callers (peek, _try_pop_atomic) hold @atomic, so no other writer can
+        # take the item between our read and our delete.
         cursor = await self.connection.execute(
-            """
-            SELECT rowid, priority, timestamp, data
-            FROM __beaver_priority_queues__
-            WHERE queue_name = ?
-            ORDER BY priority ASC, timestamp ASC
-            LIMIT 1
-            """,
-            (self._name,),
+            self._SQL_POP if pop else self._SQL_PEEK, (self._name,)
         )
-        result = await cursor.fetchone()
-
-        if result is None:
+        row = await cursor.fetchone()
+        if row is None:
             return None
 
-        rowid, priority, timestamp, data = result
-
-        if pop:
-            await self.connection.execute(
-                "DELETE FROM __beaver_priority_queues__ WHERE rowid = ?", (rowid,)
-            )
-
+        priority, timestamp, data = row
         return QueueItem(
             priority=priority, timestamp=timestamp, data=self._deserialize(data)
         )
@@ -172,7 +171,7 @@ class AsyncBeaverQueue[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverQueue[T]):
         async for item in self:
             data = item.data
             if self._model and isinstance(data, BaseModel):
-                data = json.loads(data.model_dump_json())
+                data = data.model_dump(mode="json")
             yield {
                 "priority": item.priority,
                 "timestamp": item.timestamp,
@@ -198,7 +197,7 @@ class AsyncBeaverQueue[T: BaseModel](AsyncBeaverBase[T], IAsyncBeaverQueue[T]):
             }
             dump_obj = {"metadata": metadata, "items": items_list}
             if fp:
-                json.dump(dump_obj, fp, indent=indent)
+                fp.write(self._encode_dump(dump_obj, indent))
                 return None
             return dump_obj
         if format == "jsonl":
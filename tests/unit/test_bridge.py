@@ -313,3 +313,122 @@ def test_manual_next_advancement(event_loop_thread):
 
     with pytest.raises(StopIteration):
         next(live_iter)
+
+
+class MockStreamObject:
+    """Generators mixing ready items, waits and failures."""
+
+    async def ready(self, n):
+        for i in range(n):
+            yield i
+
+    async def trickle(self):
+        yield "now"
+        await asyncio.sleep(0.05)
+        yield "later"
+
+    async def broken(self):
+        yield 1
+        yield 2
+        raise ValueError("stream broke")
+
+    def __init__(self):
+        self.finalized = threading.Event()
+
+    async def tail(self):
+        try:
+            yield "first"
+            await asyncio.sleep(60)
+            yield "never"
+        finally:
+            self.finalized.set()
+
+
+def test_iterator_batches_ready_items(event_loop_thread):
+    """Items available without waiting cross threads in batches."""
+    bridge = BeaverBridge(MockStreamObject(), event_loop_thread)
+
+    it = bridge.ready(1000)
+    hops = 0
+    original = it._fill
+
+    async def counting_fill():
+        nonlocal hops
+        hops += 1
+        return await original()
+
+    it._fill = counting_fill
+    assert list(it) == list(range(1000))
+    assert hops <= 5
+
+
+def test_iterator_carries_waiting_step_over(event_loop_thread):
+    """A step that has to wait is kept for the next call, not lost or repeated."""
+    bridge = BeaverBridge(MockStreamObject(), event_loop_thread)
+
+    assert list(bridge.trickle()) == ["now", "later"]
+
+
+def test_iterator_error_after_items(event_loop_thread):
+    """Items produced before a failure are delivered, then the error is raised."""
+    bridge = BeaverBridge(MockStreamObject(), event_loop_thread)
+
+    it = bridge.broken()
+    assert next(it) == 1
+    assert next(it) == 2
+    with pytest.raises(ValueError, match="stream broke"):
+        next(it)
+
+
+def _reactor_tasks(loop):
+    async def count():
+        return len(asyncio.all_tasks()) - 1
+
+    return asyncio.run_coroutine_threadsafe(count(), loop).result()
+
+
+def test_iterator_close_stops_waiting_step(event_loop_thread):
+    """close() cancels the carried-over step and finalizes the generator."""
+    stream = MockStreamObject()
+    it = BeaverBridge(stream, event_loop_thread).tail()
+    assert next(it) == "first"
+    assert _reactor_tasks(event_loop_thread) == 1
+
+    it.close()
+    assert stream.finalized.is_set()
+    assert _reactor_tasks(event_loop_thread) == 0
+    with pytest.raises(StopIteration):
+        next(it)
+
+
+def test_abandoned_iterator_is_closed(event_loop_thread):
+    """Dropping an iterator mid-stream leaves nothing running on the loop."""
+    import gc
+
+    stream = MockStreamObject()
+    it = BeaverBridge(stream, event_loop_thread).tail()
+    assert next(it) == "first"
+
+    del it
+    gc.collect()
+    assert stream.finalized.wait(timeout=1.0)
+    assert _reactor_tasks(event_loop_thread) == 0
+
+
+def test_close_open_iterators_is_scoped_to_iterators(event_loop_thread):
+    """Shutdown closes open bridge iterators and leaves other tasks alone."""
+    from beaver.bridge import close_open_iterators
+
+    stream = MockStreamObject()
+    it = BeaverBridge(stream, event_loop_thread).tail()
+    assert next(it) == "first"
+
+    async def scenario():
+        bystander = asyncio.ensure_future(asyncio.sleep(60))
+        await close_open_iterators(event_loop_thread)
+        alive = not bystander.done()
+        bystander.cancel()
+        return alive
+
+    assert asyncio.run_coroutine_threadsafe(scenario(), event_loop_thread).result()
+    assert stream.finalized.is_set()
@@ -111,3 +111,30 @@ async def test_channel_typed_model(async_db_mem: AsyncBeaverDB):
     assert isinstance(msgs[0].payload, Message)
     assert msgs[0].payload.text == "hello"
     assert msgs[0].payload.count == 1
+
+
+async def test_pubsub_rolled_back_publish_is_never_delivered(
+    async_db_mem: AsyncBeaverDB,
+):
+    """Listeners only see messages whose transaction committed."""
+    ch = async_db_mem.channel("tx")
+    received = []
+
+    async def consumer():
+        async for msg in ch.listen():
+            received.append(msg.payload)
+            if msg.payload == "kept":
+                break
+
+    task = asyncio.create_task(consumer())
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(RuntimeError):
+        async with async_db_mem.transaction():
+            await ch.publish("dropped")
+            await asyncio.sleep(0.25)  # polls would run here, mid-transaction
+            raise RuntimeError("roll back")
+
+    await ch.publish("kept")
+    await asyncio.wait_for(task, timeout=2.0)
+    assert received == ["kept"]
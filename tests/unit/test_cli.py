@@ -131,6 +131,17 @@ def test_cli_list_insert_then_get(tmp_path):
     assert json.loads(result.output) == {"v": 2}
 
 
+def test_cli_list_extend(tmp_path):
+    db_path = str(tmp_path / "x.db")
+    runner.invoke(app, ["--db", db_path, "list", "items", "push", '{"v":1}'])
+    result = runner.invoke(
+        app, ["--db", db_path, "list", "items", "extend", '[{"v":2},{"v":3}]']
+    )
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(app, ["--db", db_path, "list", "items", "get", "2"])
+    assert json.loads(result.output) == {"v": 3}
+
+
 def test_cli_list_pop(tmp_path):
     db_path = str(tmp_path / "x.db")
     runner.invoke(app, ["--db", db_path, "list", "items", "push", '{"v":1}'])
@@ -139,6 +150,16 @@ def test_cli_list_pop(tmp_path):
     assert json.loads(result.output) == {"v": 2}
 
 
+def test_cli_list_popmany(tmp_path):
+    db_path = str(tmp_path / "x.db")
+    runner.invoke(
+        app, ["--db", db_path, "list", "items", "extend", '[{"v":1},{"v":2},{"v":3}]']
+    )
+    result = runner.invoke(app, ["--db", db_path, "list", "items", "popmany", "2"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == [{"v": 3}, {"v": 2}]
+
+
 def test_cli_list_remote(remote_server):
     result = runner.invoke(
         app, ["--url", "http://test", "list", "items", "push", '{"v":1}']
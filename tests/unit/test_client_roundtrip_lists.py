@@ -61,6 +61,16 @@ async def test_delete_then_count(setup):
     assert await lst.get(0) == {"v": 2}
 
 
+@pytest.mark.asyncio
+async def test_extend_appends_in_order(setup):
+    db, client = setup
+    lst = client.list("u")
+    await lst.push({"v": 1})
+    await lst.extend([{"v": 2}, {"v": 3}])
+    assert await lst.count() == 3
+    assert await lst.get(2) == {"v": 3}
+
+
 @pytest.mark.asyncio
 async def test_insert_middle(setup):
     db, client = setup
@@ -104,6 +114,15 @@ async def test_deque_returns_first(setup):
     assert await lst.count() == 1
 
 
+@pytest.mark.asyncio
+async def test_popmany_returns_last_first(setup):
+    db, client = setup
+    lst = client.list("u")
+    await lst.extend([{"v": 1}, {"v": 2}, {"v": 3}])
+    assert await lst.popmany(2) == [{"v": 3}, {"v": 2}]
+    assert await lst.count() == 1
+
+
 @pytest.mark.asyncio
 async def test_clear(setup):
     db, client = setup
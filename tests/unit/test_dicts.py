@@ -136,6 +136,27 @@ async def test_dict_dump(async_db_mem: AsyncBeaverDB):
     assert dump["items"][0] == {"key": "theme", "value": "dark"}
 
 
+async def test_dict_dump_odd_text_to_any_encoding(async_db_mem: AsyncBeaverDB):
+    """Values the dict stores dump even when the fast encoder refuses them."""
+    import io
+    import json
+
+    d = async_db_mem.dict("odd")
+    await d.set("surrogate", "x\ud800y")
+    await d.set("accent", "café")
+    assert await d.get("surrogate") == "x\ud800y"
+
+    buffer = io.BytesIO()
+    fp = io.TextIOWrapper(buffer, encoding="ascii")
+    await d.dump(fp)
+    fp.flush()
+    dump = json.loads(buffer.getvalue().decode("ascii"))
+    assert {i["key"]: i["value"] for i in dump["items"]} == {
+        "surrogate": "x\ud800y",
+        "accent": "café",
+    }
+
+
 async def test_dict_load_overwrite_roundtrip(async_db_mem: AsyncBeaverDB, tmp_path):
     """Dump → load with overwrite restores exact state."""
     import json
@@ -112,3 +112,42 @@ async def test_events_event_metadata(async_db_mem: AsyncBeaverDB):
 
     await events.emit("click", "button1")
     await asyncio.sleep(0.1)
+
+
+async def test_events_emit_persists_to_channel(async_db_mem: AsyncBeaverDB):
+    """emit() writes exactly one message to the backing channel."""
+    events = async_db_mem.events("audit")
+
+    await events.emit("created", {"id": 1})
+
+    history = await events._channel.history()
+    assert len(history) == 1
+    assert history[0].payload.event == "created"
+    assert history[0].payload.payload == {"id": 1}
+
+
+async def test_events_listener_stops_when_last_callback_detaches(
+    async_db_mem: AsyncBeaverDB,
+):
+    """The dispatch loop only runs while at least one callback is attached."""
+    events = async_db_mem.events("lifecycle")
+    engine = await async_db_mem.pubsub_engine()
+
+    def handler(event: Event):
+        pass
+
+    handle = await events.attach("ping", handler)
+    await asyncio.sleep(0.05)
+    assert events._channel_name in engine._listeners
+
+    await handle.off()
+    assert events._listener_task is None
+    assert events._channel_name not in engine._listeners
+
+    # Re-attaching starts a fresh listener that still receives events.
+    received = []
+    await events.attach("ping", lambda event: received.append(event.payload))
+    await asyncio.sleep(0.05)
+    await events.emit("ping", "again")
+    await asyncio.sleep(0.3)
+    assert received == ["again"]
@@ -6,7 +6,8 @@ that the list-ordering layer relies on:
 1. key_between(a, b) returns a key strictly between a and b in lex order.
 2. None as either bound means "no bound on that side".
 3. Output uses only characters from the base-62 alphabet 0-9A-Za-z.
-4. Repeated insertion at a contended position grows keys at most logarithmically.
+4. Repeated insertion at a contended position grows keys at most linearly.
+5. Appends and prepends grow keys logarithmically.
 """
 
 import random
@@ -97,6 +98,29 @@ def test_contended_insert_does_not_crash():
     assert len(high) <= 300, f"key grew too long: {high!r} (len={len(high)})"
 
 
+def test_appends_and_prepends_grow_logarithmically():
+    # Halving toward an open end used to add a character every ~6 keys and
+    # hit the recursion limit after ~6000 pushes.
+    after = before = key_between(None, None)
+    for _ in range(100_000):
+        nxt = key_between(after, None)
+        assert nxt > after and not nxt.endswith("0")
+        after = nxt
+        nxt = key_between(None, before)
+        assert nxt < before and not nxt.endswith("0")
+        before = nxt
+    assert len(after) <= 8
+    assert len(before) <= 8
+
+
+def test_long_keys_do_not_exhaust_recursion():
+    # Keys minted by older releases can be thousands of characters long.
+    long_key = "z" * 5000 + "s"
+    assert key_between(long_key, None) > long_key
+    low, high = "V" + "0" * 5000 + "1", "V" + "0" * 5000 + "2"
+    assert low < key_between(low, high) < high
+
+
 def test_random_fuzz_preserves_strict_ordering():
     rng = random.Random(0xBEEF)
     keys = sorted([key_between(None, None)])
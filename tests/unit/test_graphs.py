@@ -70,3 +70,106 @@ async def test_graph_edges_iterator(async_db_mem: AsyncBeaverDB):
         edges.append((e.target, e.label))
 
     assert sorted(edges) == [("y", "link1"), ("z", "link2")]
+
+
+async def test_graph_traverse(async_db_mem: AsyncBeaverDB):
+    """traverse() returns reachable nodes in BFS order, bounded by depth."""
+    g = async_db_mem.graph("bfs")
+    await g.link("a", "b", "next")
+    await g.link("b", "c", "next")
+    await g.link("c", "a", "next")  # cycle back to the source
+    await g.link("a", "x", "other")
+
+    assert await g.traverse("a", label="next", depth=1) == ["b"]
+    assert await g.traverse("a", label="next", depth=5) == ["b", "c"]
+    assert sorted(await g.traverse("a")) == ["b", "x"]
+
+    with pytest.raises(ValueError):
+        await g.traverse("a", depth=0)
+
+
+async def test_graph_adjacency_cache_invalidates_on_write(db_path):
+    """With caching on, link/unlink/clear are visible to the next read."""
+    db = AsyncBeaverDB(db_path, cache_timeout=60.0)
+    await db.connect()
+    try:
+        g = db.graph("cached")
+        await g.link("a", "b", "next")
+        assert [c async for c in g.children("a")] == ["b"]
+
+        await g.link("a", "c", "next")
+        assert sorted([c async for c in g.children("a")]) == ["b", "c"]
+        assert [p async for p in g.parents("c")] == ["a"]
+
+        await g.unlink("a", "b", "next")
+        assert [c async for c in g.children("a")] == ["c"]
+
+        await g.clear()
+        assert [c async for c in g.children("a")] == []
+    finally:
+        await db.close()
+
+
+async def test_graph_adjacency_cache_sees_other_connections(db_path):
+    """Writes from another connection invalidate the cache after cache_timeout."""
+    reader = AsyncBeaverDB(db_path, cache_timeout=0.05)
+    writer = AsyncBeaverDB(db_path)
+    await reader.connect()
+    await writer.connect()
+    try:
+        await writer.graph("shared").link("a", "b", "next")
+        g = reader.graph("shared")
+        assert await g.traverse("a") == ["b"]
+
+        await writer.graph("shared").link("b", "c", "next")
+        await asyncio.sleep(0.1)
+
+        assert await g.traverse("a", depth=2) == ["b", "c"]
+    finally:
+        await writer.close()
+        await reader.close()
+
+
+async def test_graph_adjacency_cache_is_bounded(db_path, monkeypatch):
+    """The cache evicts least recently used nodes instead of growing forever."""
+    db = AsyncBeaverDB(db_path, cache_timeout=60.0)
+    await db.connect()
+    try:
+        g = db.graph("chain")
+        monkeypatch.setattr(g, "_ADJACENCY_MAX_ENTRIES", 3)
+        await g.bulk_link([(str(i), str(i + 1), "next") for i in range(10)])
+
+        assert await g.traverse("0", depth=10) == [str(i) for i in range(1, 11)]
+        assert len(g._adjacency) == 3
+        assert list(g._adjacency) == [("out", str(i), None) for i in (7, 8, 9)]
+    finally:
+        await db.close()
+
+
+async def test_graph_bulk_link(async_db_mem: AsyncBeaverDB):
+    """bulk_link() writes many edges, with optional metadata, in one call."""
+    g = async_db_mem.graph("bulk")
+    await g.bulk_link(
+        [
+            ("a", "b", "next"),
+            ("a", "c", "next", {"weight": 2}),
+            ("b", "c", "next"),
+        ]
+    )
+
+    assert await g.count() == 3
+    assert sorted([c async for c in g.children("a")]) == ["b", "c"]
+    assert (await g.get("a", "c", "next")).metadata == {"weight": 2}
+
+
+async def test_graph_parents_uses_target_index(async_db_mem: AsyncBeaverDB):
+    """Reverse traversal must seek on target, not scan the whole collection."""
+    g = async_db_mem.graph("plan")
+    for labelled in (False, True):
+        cursor = await async_db_mem.connection.execute(
+            "EXPLAIN QUERY PLAN " + g._SQL_PARENTS[labelled],
+            ("plan", "x", "l") if labelled else ("plan", "x"),
+        )
+        detail = " ".join(row[3] for row in await cursor.fetchall())
+        assert "idx_edges_target_label" in detail
+        assert "target_item_id=?" in detail
@@ -1,5 +1,11 @@
 import asyncio
+import io
+import json
+
 import pytest
+from pydantic import BaseModel
+from pydantic_core import to_json
+
 from beaver import AsyncBeaverDB
 
 # Run all tests with the async loop
@@ -23,6 +29,20 @@ async def test_list_push_pop(async_db_mem: AsyncBeaverDB):
     assert await l.count() == 0
 
 
+async def test_list_popmany(async_db_mem: AsyncBeaverDB):
+    """popmany() removes items from the end, last item first."""
+    l = async_db_mem.list("stack_many")
+    await l.extend(list(range(5)))
+
+    assert await l.popmany(3) == [4, 3, 2]
+    assert await l.popmany(0) == []
+    assert await l.popmany(10) == [1, 0]
+    assert await l.count() == 0
+
+    with pytest.raises(ValueError):
+        await l.popmany(-1)
+
+
 async def test_list_prepend_deque(async_db_mem: AsyncBeaverDB):
     """Test standard Queue (FIFO) behavior."""
     l = async_db_mem.list("queue")
@@ -63,9 +83,23 @@ async def test_list_get_set_delete(async_db_mem: AsyncBeaverDB):
     assert await l.count() == 2
     assert await l.get(1) == "c"
 
+    # Negative indices count from the end
+    assert await l.get(-1) == "c"
+    assert await l.get(-2) == "a"
+    await l.set(-1, "z")
+    assert await l.get(1) == "z"
+
     # Verify index out of bounds
     with pytest.raises(IndexError):
         await l.get(99)
+    for bad in (2, -3):
+        with pytest.raises(IndexError):
+            await l.get(bad)
+        with pytest.raises(IndexError):
+            await l.set(bad, "x")
+        with pytest.raises(IndexError):
+            await l.delete(bad)
+    assert await l.count() == 2
 
 
 async def test_list_slicing(async_db_mem: AsyncBeaverDB):
@@ -86,6 +120,15 @@ async def test_list_slicing(async_db_mem: AsyncBeaverDB):
     assert await l.get(slice(None, 2)) == [0, 1]
 
 
+async def test_list_iteration_across_chunks(async_db_mem: AsyncBeaverDB):
+    """Iteration yields every item in order, across fetch-chunk boundaries."""
+    l = async_db_mem.list("iter")
+    await l.extend(list(range(10)))
+    l._ITER_CHUNK = 3
+
+    assert [item async for item in l] == list(range(10))
+
+
 async def test_list_insert(async_db_mem: AsyncBeaverDB):
     """Test inserting items at arbitrary positions."""
     l = async_db_mem.list("insertion")
@@ -107,6 +150,101 @@ async def test_list_insert(async_db_mem: AsyncBeaverDB):
     await l.insert(4, "suffix")
     assert await l.get(4) == "suffix"
 
+    # Past the end appends
+    await l.insert(100, "tail")
+    assert await l.get(-1) == "tail"
+    assert await l.count() == 6
+
+
+async def test_list_positional_lookup_walks_index_only(async_db_mem: AsyncBeaverDB):
+    """The OFFSET walk behind l[i] must stay on the covering primary-key index."""
+    l = async_db_mem.list("plan")
+    for from_end in (False, True):
+        cursor = await async_db_mem.connection.execute(
+            "EXPLAIN QUERY PLAN " + l._SQL_VALUE_AT[from_end], ("plan", 0)
+        )
+        detail = " ".join(row[3] for row in await cursor.fetchall())
+        assert "USING COVERING INDEX" in detail
+        assert "rowid=?" in detail
+
+
+async def test_list_contains_uses_value_index(db_path):
+    """With index_list_values=True, membership tests seek on the value."""
+    db = AsyncBeaverDB(db_path, index_list_values=True)
+    await db.connect()
+    try:
+        l = db.list("members")
+        await l.extend(["a", "b", "c"])
+        assert await l.contains("b")
+        assert not await l.contains("z")
+
+        cursor = await db.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT 1 FROM __beaver_lists__ WHERE list_name = ? AND item_value = ? LIMIT 1",
+            ("members", '"b"'),
+        )
+        detail = " ".join(row[3] for row in await cursor.fetchall())
+        assert "idx_lists_value" in detail
+    finally:
+        await db.close()
+
+
+async def test_list_value_index_is_opt_in(async_db_mem: AsyncBeaverDB):
+    """By default no value index is built; contains() still answers by scan."""
+    l = async_db_mem.list("members")
+    await l.extend(["a", "b", "c"])
+    assert await l.contains("b")
+
+    cursor = await async_db_mem.connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'idx_lists_value'"
+    )
+    assert await cursor.fetchone() is None
+
+
+async def test_list_extend(async_db_mem: AsyncBeaverDB):
+    """extend() appends many items after the existing ones, in order."""
+    l = async_db_mem.list("bulk")
+    await l.prepend("head")
+    await l.extend([f"v{i}" for i in range(100)])
+    await l.extend([])
+    await l.push("tail")
+
+    items = [item async for item in l]
+    assert items == ["head"] + [f"v{i}" for i in range(100)] + ["tail"]
+
+
+async def test_list_concurrent_pushes_serialize(async_db_mem: AsyncBeaverDB):
+    """Concurrent writers from one loop queue on the writer lock; none are lost."""
+    l = async_db_mem.list("concurrent")
+
+    await asyncio.gather(*(l.push(i) for i in range(50)))
+
+    assert await l.count() == 50
+    assert sorted([item async for item in l]) == list(range(50))
+
+
+async def test_list_get_skips_uncommitted_items(async_db_mem: AsyncBeaverDB):
+    """l[i] never returns an item another task's transaction may roll back."""
+    l = async_db_mem.list("phantom")
+    pushed = asyncio.Event()
+
+    async def writer():
+        with pytest.raises(RuntimeError):
+            async with async_db_mem.transaction():
+                await l.push("phantom")
+                pushed.set()
+                await asyncio.sleep(0.1)
+                raise RuntimeError("roll back")
+
+    task = asyncio.create_task(writer())
+    await pushed.wait()
+    with pytest.raises(IndexError):
+        await l.get(0)
+    await task
+
+    async with async_db_mem.transaction():
+        await l.push("own")
+        assert await l.get(0) == "own"
+
 
 async def test_list_iteration(async_db_mem: AsyncBeaverDB):
     """Test async iteration logic."""
@@ -152,6 +290,85 @@ async def test_list_dump(async_db_mem: AsyncBeaverDB):
     assert dump["items"] == ["data"]
 
 
+async def test_list_reads_text_only_stdlib_json_accepts(async_db_mem: AsyncBeaverDB):
+    """Values json.dumps writes but strict parsers refuse still read back."""
+    l = async_db_mem.list("odd_text")
+    await l.extend(["\ud800", float("nan"), 10**30])
+
+    assert await l.get(0) == "\ud800"
+    items = [item async for item in l]
+    assert items[0] == "\ud800" and items[1] != items[1] and items[2] == 10**30
+
+
+class Point(BaseModel):
+    x: int
+    label: str | None = None
+
+
+async def test_list_dump_typed_items_as_json(async_db_mem: AsyncBeaverDB):
+    """Typed lists dump each item as its JSON-mode model dump, in order."""
+    l = async_db_mem.list("points", model=Point)
+    points = [Point(x=2, label="b"), Point(x=1)]
+    await l.extend(points)
+
+    dump = await l.dump()
+    assert dump["metadata"]["count"] == 2
+    assert dump["items"] == [p.model_dump(mode="json") for p in points]
+
+
+async def test_list_dump_odd_text_to_any_encoding(async_db_mem: AsyncBeaverDB):
+    """Lone surrogates and non-ASCII text dump as escapes, indented or not."""
+    l = async_db_mem.list("odd_dump")
+    await l.extend(["x\ud800y", "café"])
+    typed = async_db_mem.list("odd_points", model=Point)
+    await typed.push(Point(x=1, label="café"))
+
+    for indent in (2, None):
+        for source, expected in (
+            (l, ["x\ud800y", "café"]),
+            (typed, [{"x": 1, "label": "café"}]),
+        ):
+            buffer = io.BytesIO()
+            fp = io.TextIOWrapper(buffer, encoding="ascii")
+            await source.dump(fp, indent=indent)
+            fp.flush()
+            dump = json.loads(buffer.getvalue().decode("ascii"))
+            assert dump["items"] == expected
+
+    buffer = io.BytesIO()
+    fp = io.TextIOWrapper(buffer, encoding="ascii")
+    await typed.dump(fp, format="jsonl")
+    fp.flush()
+    assert json.loads(buffer.getvalue().decode("ascii")) == {"x": 1, "label": "café"}
+
+
+async def test_list_typed_batch_reads(async_db_mem: AsyncBeaverDB):
+    """Iteration, slices and popmany decode typed items a batch at a time."""
+    l = async_db_mem.list("typed_batch", model=Point)
+    points = [Point(x=i) for i in range(5)]
+    await l.extend(points)
+
+    assert [p async for p in l] == points
+    assert await l.get(slice(1, 3)) == points[1:3]
+    assert await l.popmany(2) == [points[4], points[3]]
+
+
+async def test_list_dump_to_file_streams_same_document(async_db_mem: AsyncBeaverDB):
+    """Writing to fp streams the same, identically indented, document."""
+    l = async_db_mem.list("streamed")
+    await l.extend([1, "two", {"three": [3, {"x": None}]}, []])
+
+    fp = io.StringIO()
+    await l.dump(fp)
+    text = fp.getvalue()
+    written = json.loads(text)
+    assert text == to_json(written, indent=2).decode()
+
+    expected = await l.dump()
+    expected["metadata"]["dump_date"] = written["metadata"]["dump_date"]
+    assert written == expected
+
+
 async def test_list_load_overwrite_roundtrip(async_db_mem: AsyncBeaverDB, tmp_path):
     """Dump → load with overwrite restores list order."""
     src = async_db_mem.list("source")
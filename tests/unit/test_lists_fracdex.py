@@ -27,6 +27,17 @@ async def test_insert_at_contended_index_does_not_crash(async_db_mem: AsyncBeave
     assert await lst.get(-1) == "last"
 
 
+async def test_many_pushes_and_prepends_do_not_crash(async_db_mem: AsyncBeaverDB):
+    """Appending used to grow keys linearly and crashed after ~6000 items."""
+    lst = async_db_mem.list("long")
+    await lst.extend(list(range(10_000)))
+    await lst.push("tail")
+    await lst.prepend("head")
+    assert await lst.count() == 10_002
+    assert await lst.get(0) == "head"
+    assert await lst.get(-1) == "tail"
+
+
 async def test_insert_preserves_strict_ordering(async_db_mem: AsyncBeaverDB):
     """After many inserts, iterating the list returns items in the order
     they would be in if the list were maintained in-memory."""
@@ -94,6 +94,86 @@ async def test_lock_wait_timeout(async_db_mem: AsyncBeaverDB):
     assert duration >= 0.2
 
 
+async def test_lock_quick_handoff(async_db_mem: AsyncBeaverDB):
+    """A lock released soon is picked up before a full poll_interval passes."""
+    holder = async_db_mem.lock("handoff")
+    await holder.acquire()
+
+    async def release_soon():
+        await asyncio.sleep(0.05)
+        await holder.release()
+
+    task = asyncio.create_task(release_soon())
+    start = time.time()
+    waiter = async_db_mem.lock("handoff", poll_interval=2.0)
+    assert await waiter.acquire() is True
+    assert time.time() - start < 1.0
+
+    await task
+    await waiter.release()
+
+
+async def test_lock_local_release_wakes_waiter(async_db_mem: AsyncBeaverDB):
+    """A release in this process wakes local waiters without waiting a poll."""
+    holder = async_db_mem.lock("local_wake")
+    await holder.acquire()
+
+    waiter = async_db_mem.lock("local_wake", poll_interval=10.0)
+    task = asyncio.create_task(waiter.acquire())
+    await asyncio.sleep(1.5)  # The waiter is now backing off for over a second
+
+    released = time.time()
+    await holder.release()
+    assert await task is True
+    assert time.time() - released < 0.5
+
+    await waiter.release()
+    assert async_db_mem._lock_waiters == {}
+
+
+async def test_lock_rolled_back_release_keeps_lock(async_db_mem: AsyncBeaverDB):
+    """A release whose transaction rolls back never hands the lock over."""
+    holder = async_db_mem.lock("rollback")
+    await holder.acquire()
+
+    waiter = async_db_mem.lock("rollback", poll_interval=0.05)
+    task = asyncio.create_task(waiter.acquire())
+    await asyncio.sleep(0.1)
+
+    with pytest.raises(RuntimeError):
+        async with async_db_mem.transaction():
+            await holder.release()
+            await asyncio.sleep(0.3)  # polls would run here, mid-transaction
+            raise RuntimeError("roll back")
+
+    await asyncio.sleep(0.1)
+    assert not task.done()
+
+    await async_db_mem.lock("rollback").clear()
+    assert await task is False
+
+
+async def test_lock_release_in_transaction_wakes_on_commit(
+    async_db_mem: AsyncBeaverDB,
+):
+    """A release inside a transaction wakes local waiters once it commits."""
+    holder = async_db_mem.lock("commit_wake")
+    await holder.acquire()
+
+    waiter = async_db_mem.lock("commit_wake", poll_interval=10.0)
+    task = asyncio.create_task(waiter.acquire())
+    await asyncio.sleep(1.5)  # The waiter is now backing off for over a second
+
+    async with async_db_mem.transaction():
+        await holder.release()
+        assert async_db_mem._after_commit
+
+    committed = time.time()
+    assert await task is True
+    assert time.time() - committed < 0.5
+    await waiter.release()
+
+
 async def test_lock_fairness(async_db_mem: AsyncBeaverDB):
     """Test FIFO ordering of waiters."""
     lock = async_db_mem.lock("fair_lock")
@@ -134,3 +214,9 @@ async def test_lock_clear(async_db_mem: AsyncBeaverDB):
     # Lock1 thinks it has it, but it's gone from DB
     # Lock2 can now acquire
     assert await lock2.acquire(block=False) is True
+
+
+async def test_lock_waiter_ids_unique(async_db_mem: AsyncBeaverDB):
+    """Each lock object gets its own waiter id, even for the same name."""
+    ids = {async_db_mem.lock("same")._waiter_id for _ in range(100)}
+    assert len(ids) == 100
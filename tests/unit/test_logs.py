@@ -1,11 +1,16 @@
 import asyncio
 import pytest
 import time
+from pydantic import BaseModel
 from beaver import AsyncBeaverDB
 
 pytestmark = pytest.mark.asyncio
 
 
+class Reading(BaseModel):
+    temp: float
+
+
 async def test_log_append_range(async_db_mem: AsyncBeaverDB):
     """Test basic logging and range retrieval."""
     log = async_db_mem.log("syslog")
@@ -60,6 +65,79 @@ async def test_log_collision_handling(async_db_mem: AsyncBeaverDB):
     assert timestamps == sorted(timestamps)  # Monotonic
 
 
+async def test_log_concurrent_calls_coalesce(async_db_mem: AsyncBeaverDB):
+    """Concurrent log() calls share transactions and each one is committed."""
+    log = async_db_mem.log("burst")
+    ts = time.time()
+
+    await asyncio.gather(*(log.log(i, timestamp=ts) for i in range(200)))
+
+    entries = await log.range()
+    assert sorted(e.data for e in entries) == list(range(200))
+    assert len({e.timestamp for e in entries}) == 200
+    assert log._flush_task is None and log._log_queue == []
+
+
+async def test_log_cancelled_while_queued_is_not_written(
+    async_db_mem: AsyncBeaverDB,
+):
+    """A caller cancelled before its entry commits leaves no entry behind."""
+    log = async_db_mem.log("cancelled")
+    tasks = [asyncio.create_task(log.log(i)) for i in range(50)]
+    await asyncio.sleep(0)  # the first writes directly, the rest queue
+    for task in tasks[10:]:
+        task.cancel()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(r is None for r in results[:10])
+    assert all(isinstance(r, asyncio.CancelledError) for r in results[10:])
+    assert sorted(e.data for e in await log.range()) == list(range(10))
+
+
+async def test_log_failed_batch_replays_per_entry(async_db_mem: AsyncBeaverDB):
+    """One bad entry fails only its own caller; the rest of the batch commits."""
+    log = async_db_mem.log("replay", indexed=["v"])
+    values = [{"v": i} for i in range(10)]
+    values[5] = {"v": [1, 2]}  # not indexable
+
+    results = await asyncio.gather(
+        *(log.log(v) for v in values), return_exceptions=True
+    )
+    assert isinstance(results[5], TypeError)
+    assert all(r is None for i, r in enumerate(results) if i != 5)
+    assert sorted(e.data["v"] for e in await log.range()) == [
+        i for i in range(10) if i != 5
+    ]
+
+
+async def test_log_cancelled_flusher_releases_callers(async_db_mem: AsyncBeaverDB):
+    """Cancelling the flusher cancels its callers; none hangs, none is half-told."""
+    log = async_db_mem.log("flusher")
+    tasks = [asyncio.create_task(log.log(i)) for i in range(20)]
+    while log._flush_task is None:
+        await asyncio.sleep(0)
+    log._flush_task.cancel()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*tasks, return_exceptions=True), timeout=1.0
+    )
+    written = [i for i, r in enumerate(results) if r is None]
+    assert all(isinstance(r, asyncio.CancelledError) for r in results if r is not None)
+    assert sorted(e.data for e in await log.range()) == written
+    assert log._flush_task is None and log._log_queue == []
+
+
+async def test_log_inside_transaction(async_db_mem: AsyncBeaverDB):
+    """log() inside the caller's transaction writes in place, not via a queue."""
+    log = async_db_mem.log("in_tx")
+
+    async with async_db_mem.transaction():
+        await log.log("a")
+        await log.log("b")
+
+    assert [e.data for e in await log.range()] == ["a", "b"]
+
+
 async def test_log_live_tailing(async_db_mem: AsyncBeaverDB):
     """Test the live() async generator."""
     log = async_db_mem.log("live_feed")
@@ -159,3 +237,121 @@ async def test_log_pydantic_round_trip(async_db_mem: AsyncBeaverDB):
     assert entries[0].data.cpu == 12.5
     assert entries[0].data.host == "vps"
     assert entries[1].data.memory == 2048
+
+
+async def test_log_live_aggregate(async_db_mem: AsyncBeaverDB):
+    """live_aggregate() computes the window aggregate in SQL."""
+    log = async_db_mem.log("metrics")
+    now = time.time()
+    await log.log({"cpu": 10.0}, timestamp=now - 120)  # outside the window
+    await log.log({"cpu": 20.0}, timestamp=now - 2)
+    await log.log({"cpu": 40.0}, timestamp=now - 1)
+
+    stream = log.live_aggregate("avg", "cpu", window=60, period=0.01)
+    assert await anext(stream) == 30.0
+    await log.log({"cpu": 60.0})
+    assert await anext(stream) == 40.0
+    await stream.aclose()
+
+    counts = log.live_aggregate("count", window=60, period=0.01)
+    assert await anext(counts) == 3
+    await counts.aclose()
+
+    empty = async_db_mem.log("empty").live_aggregate("max", "cpu", period=0.01)
+    assert await anext(empty) is None
+    await empty.aclose()
+
+
+async def test_log_live_aggregate_rejects_bad_input(async_db_mem: AsyncBeaverDB):
+    """Unknown functions and model fields fail loudly instead of yielding None."""
+    with pytest.raises(ValueError, match="fn must be one of"):
+        await anext(async_db_mem.log("metrics").live_aggregate("median", "cpu"))
+
+    typed = async_db_mem.log("typed", model=Reading)
+    with pytest.raises(ValueError, match="no field 'cpu'"):
+        await anext(typed.live_aggregate("avg", "cpu"))
+
+
+async def test_log_window_queries_seek_on_timestamp(async_db_mem: AsyncBeaverDB):
+    """Rolling windows must seek on (log_name, timestamp), not scan the log."""
+    log = async_db_mem.log("plan")
+    for query, params in (
+        (log._SQL_WINDOW_AGGREGATE.format(fn="AVG"), ("$.cpu", "plan", 0.0)),
+        (log._SQL_WINDOW_COUNT, ("plan", 0.0)),
+    ):
+        cursor = await async_db_mem.connection.execute(
+            "EXPLAIN QUERY PLAN " + query, params
+        )
+        detail = " ".join(row[3] for row in await cursor.fetchall())
+        assert "SEARCH" in detail
+        assert "timestamp>?" in detail
+
+
+async def test_log_live_wakes_on_local_write(async_db_mem: AsyncBeaverDB):
+    """A write from this process reaches live() without waiting out the poll."""
+    log = async_db_mem.log("instant")
+    stream = log.live(poll_interval=60)
+    first = asyncio.ensure_future(anext(stream))
+    await asyncio.sleep(0.05)  # let the tail take its first (empty) poll
+
+    await log.log("ping")
+    entry = await asyncio.wait_for(first, timeout=1.0)
+    assert entry.data == "ping"
+
+    await stream.aclose()
+    assert "instant" not in async_db_mem._log_tails
+
+
+async def test_log_range_across_chunks(async_db_mem: AsyncBeaverDB):
+    """range() reads in chunks; results stay complete, ordered and typed."""
+    log = async_db_mem.log("many", model=Reading)
+    async with log.batched() as batch:
+        for i in range(2500):
+            batch.log(Reading(temp=i), timestamp=1000.0 + i)
+
+    entries = await log.range()
+    assert len(entries) == 2500
+    assert [e.timestamp for e in entries] == [1000.0 + i for i in range(2500)]
+    assert entries[1234].data == Reading(temp=1234)
+
+
+async def test_log_repeated_clock_reads_step_forward(
+    async_db_mem: AsyncBeaverDB, monkeypatch
+):
+    """A stalled clock yields strictly increasing timestamps, in call order."""
+    log = async_db_mem.log("burst")
+    monkeypatch.setattr("beaver.logs.time.time", lambda: 5000.0)
+
+    await asyncio.gather(*(log.log(i) for i in range(50)))
+    await log.log("backfill", timestamp=10.0)
+
+    entries = await log.range()
+    assert entries[0].timestamp == 10.0
+    assert [e.data for e in entries[1:]] == list(range(50))
+    stamps = [e.timestamp for e in entries[1:]]
+    assert stamps[0] == 5000.0
+    assert all(a < b for a, b in zip(stamps, stamps[1:]))
+
+
+async def test_log_ordered_reads_skip_the_sorter(async_db_mem: AsyncBeaverDB):
+    """Tail and range scans come out of the index in order, with no sort step."""
+    log = async_db_mem.log("plan")
+    await log.log("warm-up", timestamp=1.0)
+
+    # Capture the statements range() actually runs, with their bound values.
+    statements: list[str] = []
+    await async_db_mem.connection.set_trace_callback(statements.append)
+    for order in ("ASC", "DESC"):
+        await log.range(start=0.0, order=order)
+    await async_db_mem.connection.set_trace_callback(None)
+    range_sql = [sql for sql in statements if "FROM __beaver_logs__" in sql]
+    assert len(range_sql) == 2
+
+    plans = [(log._SQL_TAIL, ("plan", 0.0))] + [(sql, ()) for sql in range_sql]
+    for query, params in plans:
+        cursor = await async_db_mem.connection.execute(
+            "EXPLAIN QUERY PLAN " + query, params
+        )
+        detail = " ".join(row[3] for row in await cursor.fetchall())
+        assert "SEARCH" in detail
+        assert "TEMP B-TREE" not in detail
@@ -46,3 +46,7 @@ def test_load_is_local_only():
 
 def test_batched_is_local_only():
     assert hasattr(AsyncBeaverLog.batched, "__beaver_local_only__")
+
+
+def test_live_aggregate_is_local_only():
+    assert hasattr(AsyncBeaverLog.live_aggregate, "__beaver_local_only__")
@@ -39,10 +39,12 @@ async def test_router_has_all_list_routes(db):
     assert ("/lists/{name}/item/{index}", ("DELETE",)) in paths
     assert ("/lists/{name}/contains", ("GET",)) in paths
     assert ("/lists/{name}/push", ("POST",)) in paths
+    assert ("/lists/{name}/extend", ("POST",)) in paths
     assert ("/lists/{name}/prepend", ("POST",)) in paths
     assert ("/lists/{name}/insert/{index}", ("POST",)) in paths
     assert ("/lists/{name}/pop", ("POST",)) in paths
     assert ("/lists/{name}/deque", ("POST",)) in paths
+    assert ("/lists/{name}/popmany", ("POST",)) in paths
     assert ("/lists/{name}/clear", ("POST",)) in paths
 
 